@@ -4,6 +4,7 @@ example_usage.py - Demonstrates using the SevenZip Python bindings
 This example shows common usage patterns for the SevenZip library.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -20,6 +21,16 @@ def print_section(title: str):
     print('=' * 60)
 
 
+def walk_files(directory: str):
+    """Yield file paths under directory, using the stat info cached by os.scandir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
 def example_version_info():
     """Show version information."""
     print_section("Version Information")
@@ -145,10 +156,8 @@ def example_extract_archive(archive_path: str):
         
         # List extracted files
         print("\nExtracted files:")
-        for path in sorted(output_dir.rglob("*")):
-            if path.is_file():
-                rel_path = path.relative_to(output_dir)
-                print(f"  {rel_path}")
+        for path in sorted(walk_files(str(output_dir))):
+            print(f"  {os.path.relpath(path, output_dir)}")
         
     except SevenZipError as e:
         print(f"\n✗ Error: {e}")
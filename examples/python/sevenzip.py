@@ -25,17 +25,30 @@ SevenZip Python Bindings - 使用ctypes封装FFI C API
 
 import ctypes
 from ctypes import c_char_p, c_void_p, c_uint32, c_uint64, c_size_t, c_int, POINTER, Structure
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
+from functools import cached_property
 from pathlib import Path
-from typing import Optional, Union, List, Iterator
+from typing import Optional, Union, Callable, List, Dict, Iterator
 import os
 import sys
+import weakref
 
 
 # ============================================================================
 # 加载DLL
 # ============================================================================
 
+def _open_library(path: str) -> ctypes.CDLL:
+    """以固定的加载标志打开动态库"""
+    if sys.platform == 'win32':
+        # 保留ctypes默认的安全DLL搜索标志，不回退到当前目录/PATH搜索
+        return ctypes.CDLL(path)
+    # RTLD_NOW：加载时一次性解析全部符号，而不是在每个函数首次调用时延迟绑定；
+    # RTLD_LOCAL：不把静态链接的7-Zip符号导出到全局命名空间
+    return ctypes.CDLL(path, mode=os.RTLD_NOW | os.RTLD_LOCAL)
+
+
 def _load_library():
     """加载sevenzip_ffi动态库"""
     if sys.platform == 'win32':
@@ -47,7 +60,7 @@ def _load_library():
     
     # 尝试多个路径
     search_paths = [
-        Path(__file__).parent / 'lib' / lib_name,  # 相对于此文件
+        Path(__file__).parent / 'lib' / lib_name,  # 相对于此文件（与模块一同安装的位置）
         Path.cwd() / 'build' / 'windows-release' / 'bin' / 'Release' / lib_name,  # 开发环境 bin 目录
         Path.cwd() / 'build' / 'windows-release' / 'lib' / 'Release' / lib_name,  # 开发环境 lib 目录（旧）
         Path(lib_name),  # 系统路径
@@ -55,11 +68,11 @@ def _load_library():
     
     for path in search_paths:
         if path.exists():
-            return ctypes.CDLL(str(path))
+            return _open_library(str(path))
     
     # 最后尝试直接加载
     try:
-        return ctypes.CDLL(lib_name)
+        return _open_library(lib_name)
     except OSError as e:
         raise ImportError(f"无法加载 {lib_name}。尝试过的路径: {search_paths}") from e
 
@@ -72,7 +85,7 @@ _lib = _load_library()
 # ============================================================================
 
 class SzResult(IntEnum):
-    """错误码枚举"""
+    """错误码枚举（与 sz_types.h 中的 sz_result 一致）"""
     OK = 0
     FAIL = 1
     OUT_OF_MEMORY = 2
@@ -82,37 +95,63 @@ class SzResult(IntEnum):
     UNSUPPORTED_FORMAT = 6
     CORRUPTED_ARCHIVE = 7
     WRONG_PASSWORD = 8
-    UNKNOWN_ERROR = 9
+    CANCELLED = 9
     INDEX_OUT_OF_RANGE = 10
-    BUFFER_TOO_SMALL = 11
-    OPERATION_CANCELLED = 12
+    ALREADY_OPEN = 11
+    NOT_OPEN = 12
     WRITE_ERROR = 13
     READ_ERROR = 14
     NOT_IMPLEMENTED = 15
     DISK_FULL = 16
+    
+    # 旧名称，保持兼容
+    OPERATION_CANCELLED = 9
+
+
+# SzResult.OK 的纯 int 副本：每次调用后的结果检查不经过枚举属性查找
+_SZ_OK = 0
 
 
 class SzFormat(IntEnum):
-    """归档格式枚举"""
-    SEVEN_Z = 0
-    ZIP = 1
-    TAR = 2
-    GZIP = 3
-    BZIP2 = 4
-    XZ = 5
-    RAR = 6
-    CAB = 7
-    ISO = 8
-    WIM = 9
+    """归档格式枚举（与 sz_types.h 中的 sz_format 一致）"""
+    AUTO = 0
+    SEVEN_Z = 1
+    ZIP = 2
+    TAR = 3
+    GZIP = 4
+    BZIP2 = 5
+    XZ = 6
 
 
 class SzCompressionLevel(IntEnum):
-    """压缩级别枚举"""
+    """压缩级别枚举（与 sz_types.h 中的 sz_compression_level 一致）"""
     NONE = 0
     FAST = 1
-    NORMAL = 2
-    MAXIMUM = 3
-    ULTRA = 4
+    NORMAL = 5
+    MAXIMUM = 7
+    ULTRA = 9
+
+
+# 格式/级别字符串映射（模块级常量，键经过 sys.intern）
+_FORMAT_MAP = {sys.intern(name): value for name, value in {
+    '7z': SzFormat.SEVEN_Z,
+    'sevenzip': SzFormat.SEVEN_Z,
+    'zip': SzFormat.ZIP,
+    'tar': SzFormat.TAR,
+    'gzip': SzFormat.GZIP,
+    'gz': SzFormat.GZIP,
+    'bzip2': SzFormat.BZIP2,
+    'bz2': SzFormat.BZIP2,
+    'xz': SzFormat.XZ,
+}.items()}
+
+_LEVEL_MAP = {sys.intern(name): value for name, value in {
+    'none': SzCompressionLevel.NONE,
+    'fast': SzCompressionLevel.FAST,
+    'normal': SzCompressionLevel.NORMAL,
+    'maximum': SzCompressionLevel.MAXIMUM,
+    'ultra': SzCompressionLevel.ULTRA,
+}.items()}
 
 
 # 不透明句柄类型
@@ -121,6 +160,11 @@ sz_writer_handle = c_void_p
 sz_compressor_handle = c_void_p
 
 
+# 进度回调类型：在模块级创建一次，每次提取只实例化回调对象
+# int (*)(uint64_t completed, uint64_t total, void* user_data)
+_ProgressCallback = ctypes.CFUNCTYPE(c_int, c_uint64, c_uint64, c_void_p)
+
+
 class SzItemInfo(Structure):
     """归档项目信息结构 - 必须完全匹配 C 结构体定义"""
     _fields_ = [
@@ -137,14 +181,60 @@ class SzItemInfo(Structure):
     ]
 
 
+# list_items_array 返回的结构化数组中的数值字段（与 SzItemInfo 同名）
+_ITEM_ARRAY_FIELDS = [
+    ("index", f"u{ctypes.sizeof(c_size_t)}"),
+    ("size", "u8"),
+    ("packed_size", "u8"),
+    ("crc", "u4"),
+    ("has_crc", "i4"),
+    ("creation_time", "i8"),
+    ("modification_time", "i8"),
+    ("is_directory", "i4"),
+    ("is_encrypted", "i4"),
+]
+
+
+def _item_array_dtypes(np):
+    """
+    构造 list_items_array 使用的两个 dtype
+    
+    返回 (raw_dtype, dtype)：raw_dtype 按 ctypes 报告的字段偏移直接覆盖
+    SzItemInfo 数组的内存布局（跳过 path 指针），dtype 为对外返回的紧凑布局，
+    其中 path 为未解码的 bytes 对象。
+    """
+    names = [name for name, _ in _ITEM_ARRAY_FIELDS]
+    raw_dtype = np.dtype({
+        'names': names,
+        'formats': [fmt for _, fmt in _ITEM_ARRAY_FIELDS],
+        'offsets': [getattr(SzItemInfo, name).offset for name in names],
+        'itemsize': ctypes.sizeof(SzItemInfo),
+    })
+    dtype = np.dtype(_ITEM_ARRAY_FIELDS[:1] + [("path", "O")] + _ITEM_ARRAY_FIELDS[1:])
+    return raw_dtype, dtype
+
+
+def _build_items_array(np, infos: ctypes.Array):
+    """由批量获取的SzItemInfo数组构造list_items_array的结构化数组（不释放infos）"""
+    raw_dtype, dtype = _item_array_dtypes(np)
+    raw = np.frombuffer(infos, dtype=raw_dtype)
+    items = np.empty(len(infos), dtype=dtype)
+    for name, _ in _ITEM_ARRAY_FIELDS:
+        items[name] = raw[name]
+    items['path'] = [info.path or b'' for info in infos]
+    return items
+
+
 class SzArchiveInfo(Structure):
-    """归档信息结构"""
+    """归档信息结构 - 必须完全匹配 C 结构体定义"""
     _fields_ = [
-        ("format", c_int),
-        ("total_size", c_uint64),
-        ("item_count", c_uint32),
-        ("is_solid", c_int),
-        ("has_encrypted_headers", c_int),
+        ("format", c_int),                  # sz_format format
+        ("item_count", c_size_t),           # size_t item_count
+        ("total_size", c_uint64),           # uint64_t total_size
+        ("packed_size", c_uint64),          # uint64_t packed_size
+        ("is_solid", c_int),                # int is_solid
+        ("is_multi_volume", c_int),         # int is_multi_volume
+        ("has_encrypted_headers", c_int),   # int has_encrypted_headers
     ]
 
 
@@ -166,17 +256,43 @@ _lib.sz_archive_open.argtypes = [c_char_p, POINTER(sz_archive_handle)]
 _lib.sz_archive_close.restype = None
 _lib.sz_archive_close.argtypes = [sz_archive_handle]
 
+_lib.sz_archive_get_info.restype = c_int
+_lib.sz_archive_get_info.argtypes = [sz_archive_handle, POINTER(SzArchiveInfo)]
+
 _lib.sz_archive_get_item_count.restype = c_int
 _lib.sz_archive_get_item_count.argtypes = [sz_archive_handle, POINTER(c_size_t)]
 
 _lib.sz_archive_get_item_info.restype = c_int
 _lib.sz_archive_get_item_info.argtypes = [sz_archive_handle, c_size_t, POINTER(SzItemInfo)]
 
+_lib.sz_archive_get_item_info_range.restype = c_int
+_lib.sz_archive_get_item_info_range.argtypes = [
+    sz_archive_handle, c_size_t, c_size_t, POINTER(SzItemInfo)
+]
+
+_lib.sz_item_info_free.restype = None
+_lib.sz_item_info_free.argtypes = [POINTER(SzItemInfo)]
+
+_lib.sz_item_info_free_range.restype = None
+_lib.sz_item_info_free_range.argtypes = [POINTER(SzItemInfo), c_size_t]
+
 _lib.sz_archive_extract_to_memory.restype = c_int
 _lib.sz_archive_extract_to_memory.argtypes = [
     sz_archive_handle, c_size_t, POINTER(c_void_p), POINTER(c_size_t)
 ]
 
+_lib.sz_archive_set_progress_interval.restype = c_int
+_lib.sz_archive_set_progress_interval.argtypes = [sz_archive_handle, c_uint64]
+
+_lib.sz_archive_extract_all.restype = c_int
+_lib.sz_archive_extract_all.argtypes = [sz_archive_handle, c_char_p, _ProgressCallback, c_void_p]
+
+_lib.sz_archive_extract_item.restype = c_int
+_lib.sz_archive_extract_item.argtypes = [sz_archive_handle, c_size_t, c_char_p]
+
+_lib.sz_archive_verify_crc.restype = c_int
+_lib.sz_archive_verify_crc.argtypes = [sz_archive_handle, c_size_t, POINTER(c_int)]
+
 _lib.sz_memory_free.restype = None
 _lib.sz_memory_free.argtypes = [c_void_p]
 
@@ -187,6 +303,11 @@ _lib.sz_writer_create.argtypes = [c_char_p, c_int, POINTER(sz_writer_handle)]
 _lib.sz_writer_add_file.restype = c_int
 _lib.sz_writer_add_file.argtypes = [sz_writer_handle, c_char_p, c_char_p]
 
+_lib.sz_writer_add_files.restype = c_int
+_lib.sz_writer_add_files.argtypes = [
+    sz_writer_handle, POINTER(c_char_p), POINTER(c_char_p), c_size_t
+]
+
 _lib.sz_writer_add_directory.restype = c_int
 _lib.sz_writer_add_directory.argtypes = [sz_writer_handle, c_char_p, c_int]
 
@@ -205,6 +326,18 @@ _lib.sz_writer_finalize.argtypes = [sz_writer_handle]
 _lib.sz_writer_cancel.restype = None
 _lib.sz_writer_cancel.argtypes = [sz_writer_handle]
 
+# 热路径函数预绑定为模块级名称：省去每次调用时对 _lib 的属性查找。
+# 输出参数直接传入 ctypes 实例（argtypes 为 POINTER 时 ctypes 会自动取址），
+# 不再为每次调用构造 byref 包装对象。
+_sz_archive_get_item_info = _lib.sz_archive_get_item_info
+_sz_archive_get_item_info_range = _lib.sz_archive_get_item_info_range
+_sz_item_info_free = _lib.sz_item_info_free
+_sz_item_info_free_range = _lib.sz_item_info_free_range
+_sz_archive_extract_to_memory = _lib.sz_archive_extract_to_memory
+_sz_memory_free = _lib.sz_memory_free
+_sz_writer_add_file = _lib.sz_writer_add_file
+_sz_writer_add_memory = _lib.sz_writer_add_memory
+
 
 # ============================================================================
 # Python异常类
@@ -219,7 +352,7 @@ class SevenZipError(Exception):
 
 def _check_result(result: int, operation: str = "操作"):
     """检查C API返回值，失败时抛出异常"""
-    if result != SzResult.OK:
+    if result != _SZ_OK:
         error_msg = _lib.sz_get_last_error_message()
         if error_msg:
             error_msg = error_msg.decode('utf-8')
@@ -228,6 +361,23 @@ def _check_result(result: int, operation: str = "操作"):
         raise SevenZipError(f"{error_msg} (code={result})", SzResult(result))
 
 
+def _as_c_buffer(data):
+    """
+    将支持缓冲区协议的对象转换为可直接传给 c_void_p 参数的对象
+    
+    返回 (缓冲区对象, 字节长度)，缓冲区对象须在C调用结束前保持存活。
+    bytes 和可写缓冲区均为零拷贝；只读的非bytes缓冲区无法取得可写映射，复制一次。
+    """
+    if isinstance(data, bytes):
+        # ctypes 直接传递 bytes 内部缓冲区的指针
+        return data, len(data)
+    
+    view = memoryview(data).cast('B')
+    if view.readonly:
+        return view.tobytes(), view.nbytes
+    return (ctypes.c_ubyte * view.nbytes).from_buffer(view), view.nbytes
+
+
 # ============================================================================
 # Item类 - 归档项目
 # ============================================================================
@@ -235,9 +385,12 @@ def _check_result(result: int, operation: str = "操作"):
 class Item:
     """归档中的单个项目（文件或目录）"""
     
-    def __init__(self, info: SzItemInfo):
+    def __init__(self, info: SzItemInfo, archive: Optional['Archive'] = None):
+        # 弱引用：Archive通过_item_cache持有Item，强引用会形成循环
+        self._archive_ref = weakref.ref(archive) if archive is not None else None
         self.index = info.index
-        self.path = info.path.decode('utf-8') if info.path else ""
+        # 读取c_char_p字段会复制出bytes；UTF-8解码推迟到首次访问path时
+        self.path_bytes: bytes = info.path or b""
         self.size = info.size
         self.packed_size = info.packed_size
         self.compressed_size = info.packed_size  # 别名，保持兼容
@@ -248,6 +401,20 @@ class Item:
         self.creation_time = info.creation_time
         self.modification_time = info.modification_time
     
+    @cached_property
+    def path(self) -> str:
+        """项目路径（首次访问时解码）"""
+        return self.path_bytes.decode('utf-8')
+    
+    def verify(self) -> bool:
+        """校验项目数据是否与存储的CRC一致（见Archive.verify_crc）"""
+        if self._archive_ref is None:
+            raise SevenZipError("项目未关联归档")
+        archive = self._archive_ref()
+        if archive is None:
+            raise SevenZipError("所属归档已被回收")
+        return archive.verify_crc(self.index)
+    
     def __repr__(self):
         typ = "DIR" if self.is_directory else "FILE"
         return f"<Item {typ} '{self.path}' size={self.size}>"
@@ -262,6 +429,11 @@ class Archive:
     
     def __init__(self):
         self._handle: Optional[sz_archive_handle] = None
+        # 只读句柄的项目数量和项目信息不会变化，首次读取后缓存，close()时失效
+        self._item_count: Optional[int] = None
+        self._item_cache: Dict[int, Item] = {}
+        # get_item_info 复用的输出结构体，Item 会复制出所有字段
+        self._scratch_info = SzItemInfo()
     
     @classmethod
     def open(cls, path: Union[str, Path], password: Optional[str] = None) -> 'Archive':
@@ -276,7 +448,7 @@ class Archive:
             Archive实例
         """
         archive = cls()
-        path_bytes = str(path).encode('utf-8')
+        path_bytes = os.fsencode(path)
         handle = sz_archive_handle()
         
         result = _lib.sz_archive_open(path_bytes, ctypes.byref(handle))
@@ -290,6 +462,8 @@ class Archive:
         if self._handle:
             _lib.sz_archive_close(self._handle)
             self._handle = None
+        self._item_count = None
+        self._item_cache.clear()
     
     def __enter__(self):
         return self
@@ -298,26 +472,49 @@ class Archive:
         self.close()
         return False
     
+    @property
+    def is_solid(self) -> bool:
+        """是否为固实归档（多个项目共享压缩块）"""
+        if not self._handle:
+            raise SevenZipError("归档未打开")
+        
+        info = SzArchiveInfo()
+        result = _lib.sz_archive_get_info(self._handle, info)
+        _check_result(result, "获取归档信息")
+        return bool(info.is_solid)
+    
     @property
     def item_count(self) -> int:
         """获取归档中的项目数量"""
         if not self._handle:
             raise SevenZipError("归档未打开")
+        if self._item_count is not None:
+            return self._item_count
         
         count = c_size_t()
         result = _lib.sz_archive_get_item_count(self._handle, ctypes.byref(count))
         _check_result(result, "获取项目数量")
-        return count.value
+        self._item_count = count.value
+        return self._item_count
     
     def get_item_info(self, index: int) -> Item:
         """获取指定索引的项目信息"""
         if not self._handle:
             raise SevenZipError("归档未打开")
+        item = self._item_cache.get(index)
+        if item is not None:
+            return item
         
-        info = SzItemInfo()
-        result = _lib.sz_archive_get_item_info(self._handle, index, ctypes.byref(info))
+        info = self._scratch_info
+        result = _sz_archive_get_item_info(self._handle, index, info)
         _check_result(result, "获取项目信息")
-        return Item(info)
+        try:
+            item = Item(info, self)
+        finally:
+            # 释放C分配的路径字符串
+            _sz_item_info_free(info)
+        self._item_cache[index] = item
+        return item
     
     def extract_to_memory(self, index: int) -> bytes:
         """将指定项目提取到内存"""
@@ -327,9 +524,7 @@ class Archive:
         data_ptr = c_void_p()
         size = c_size_t()
         
-        result = _lib.sz_archive_extract_to_memory(
-            self._handle, index, ctypes.byref(data_ptr), ctypes.byref(size)
-        )
+        result = _sz_archive_extract_to_memory(self._handle, index, data_ptr, size)
         _check_result(result, "提取到内存")
         
         try:
@@ -338,13 +533,214 @@ class Archive:
             return data
         finally:
             # 释放C分配的内存
-            _lib.sz_memory_free(data_ptr)
+            _sz_memory_free(data_ptr)
+    
+    def extract_to_memoryview(self, index: int) -> memoryview:
+        """
+        将指定项目提取到内存，返回零拷贝的只读memoryview
+        
+        与extract_to_memory不同，数据不会被复制为bytes：memoryview直接引用
+        C分配的缓冲区，在该视图（及其派生视图）被回收后自动释放。
+        需要bytes时可调用 bytes(view)。
+        """
+        if not self._handle:
+            raise SevenZipError("归档未打开")
+        
+        data_ptr = c_void_p()
+        size = c_size_t()
+        
+        result = _sz_archive_extract_to_memory(self._handle, index, data_ptr, size)
+        _check_result(result, "提取到内存")
+        
+        if not size.value:
+            _sz_memory_free(data_ptr)
+            return memoryview(b'')
+        
+        # 直接映射C缓冲区，由finalize在缓冲区对象回收时调用sz_memory_free
+        buffer = (ctypes.c_char * size.value).from_address(data_ptr.value)
+        weakref.finalize(buffer, _sz_memory_free, data_ptr.value)
+        return memoryview(buffer).cast('B').toreadonly()
+    
+    def extract(self, output_dir: Union[str, Path],
+                progress_callback: Optional[Callable[[int, int], bool]] = None,
+                progress_interval: int = 4 << 20):
+        """
+        提取全部项目到目录
+        
+        Args:
+            output_dir: 输出目录
+            progress_callback: 可选的进度回调 callback(completed, total) -> bool（返回False取消）
+            progress_interval: 两次进度回调之间至少处理的字节数（0表示每次都回调，完成时总会回调）
+        """
+        if not self._handle:
+            raise SevenZipError("归档未打开")
+        
+        callback = None
+        if progress_callback:
+            result = _lib.sz_archive_set_progress_interval(self._handle, progress_interval)
+            _check_result(result, "设置进度间隔")
+            
+            def wrapper(completed, total, user_data):
+                return 1 if progress_callback(completed, total) else 0
+            callback = _ProgressCallback(wrapper)
+        
+        # sz_archive_extract_all返回前会卸载回调，局部变量callback在调用期间保持其存活即可
+        result = _lib.sz_archive_extract_all(self._handle, os.fsencode(output_dir), callback, None)
+        _check_result(result, "提取归档")
+    
+    def verify_crc(self, index: int) -> bool:
+        """
+        校验指定项目的数据是否与存储的CRC一致
+        
+        C层以测试模式解码该项目，由解码器校验CRC，解压数据不会输出或复制到Python。
+        数据损坏时返回False；项目没有存储CRC（如目录）时抛出SevenZipError。
+        """
+        if not self._handle:
+            raise SevenZipError("归档未打开")
+        
+        valid = c_int()
+        result = _lib.sz_archive_verify_crc(self._handle, index, valid)
+        _check_result(result, "校验CRC")
+        return bool(valid.value)
+    
+    def extract_item(self, index: int, output_dir: Union[str, Path]):
+        """
+        将指定项目直接提取到磁盘
+        
+        解压数据由C层以流式写入文件，不经过Python内存。
+        文件按其在归档中的路径写入output_dir下（自动创建父目录）。
+        
+        Args:
+            index: 项目索引
+            output_dir: 输出目录
+        """
+        if not self._handle:
+            raise SevenZipError("归档未打开")
+        
+        output_dir_bytes = os.fsencode(output_dir)
+        result = _lib.sz_archive_extract_item(self._handle, index, output_dir_bytes)
+        _check_result(result, "提取项目")
+    
+    def _read_item_infos(self) -> ctypes.Array:
+        """
+        一次FFI调用批量读取全部项目信息
+        
+        调用方负责通过 _sz_item_info_free_range 释放C分配的路径字符串。
+        """
+        count = self.item_count
+        infos = (SzItemInfo * count)()
+        if count:
+            result = _sz_archive_get_item_info_range(self._handle, 0, count, infos)
+            _check_result(result, "批量获取项目信息")
+        return infos
+    
+    def list_items_array(self):
+        """
+        以NumPy结构化数组返回全部项目信息（需要安装numpy）
+        
+        数值字段直接从批量获取的C结构体数组整列复制，不为每个项目创建Item对象，
+        适合在大型归档上按大小、CRC、时间等字段做向量化筛选和排序。
+        path字段保存未解码的UTF-8 bytes。
+        """
+        import numpy as np
+        
+        infos = self._read_item_infos()
+        try:
+            return _build_items_array(np, infos)
+        finally:
+            # 释放C分配的路径字符串
+            _sz_item_info_free_range(infos, len(infos))
+    
+    def total_packed_size(self) -> int:
+        """所有非目录项目的压缩后总大小（只读取数值列向量化求和，需要numpy）"""
+        import numpy as np
+        
+        raw_dtype, _ = _item_array_dtypes(np)
+        infos = self._read_item_infos()
+        try:
+            raw = np.frombuffer(infos, dtype=raw_dtype)
+            return int(raw['packed_size'][raw['is_directory'] == 0].sum())
+        finally:
+            _sz_item_info_free_range(infos, len(infos))
+    
+    def filter(self, predicate) -> List[Item]:
+        """
+        按向量化条件筛选项目（需要numpy）
+        
+        结构化数组与结果Item由同一次批量获取构造，不再逐个调用get_item_info。
+        
+        Args:
+            predicate: 接收list_items_array()返回的结构化数组并返回布尔掩码的函数，
+                例如 lambda a: (a['size'] > 1 << 20) & (a['is_directory'] == 0)
+        
+        Returns:
+            满足条件的Item列表
+        """
+        import numpy as np
+        
+        infos = self._read_item_infos()
+        try:
+            mask = np.asarray(predicate(_build_items_array(np, infos)), dtype=bool)
+            matches = []
+            for index in np.flatnonzero(mask).tolist():
+                item = self._item_cache.get(index)
+                if item is None:
+                    item = self._item_cache[index] = Item(infos[index], self)
+                matches.append(item)
+        finally:
+            _sz_item_info_free_range(infos, len(infos))
+        return matches
+    
+    def find(self, suffix: Optional[str] = None,
+             min_size: Optional[int] = None,
+             max_size: Optional[int] = None,
+             include_directories: bool = False) -> List[Item]:
+        """
+        按常用条件查找项目（需要numpy）
+        
+        各条件在list_items_array上整列计算，扫描过程不逐个构造Item或解码路径。
+        
+        Args:
+            suffix: 路径后缀，例如 '.xml'
+            min_size: 最小未压缩大小（含）
+            max_size: 最大未压缩大小（含）
+            include_directories: 是否包含目录
+        
+        Returns:
+            满足全部条件的Item列表
+        """
+        import numpy as np
+        
+        def predicate(items):
+            mask = np.ones(len(items), dtype=bool)
+            if not include_directories:
+                mask &= items['is_directory'] == 0
+            if min_size is not None:
+                mask &= items['size'] >= min_size
+            if max_size is not None:
+                mask &= items['size'] <= max_size
+            if suffix is not None:
+                paths = items['path'].astype(bytes)
+                mask &= np.char.endswith(paths, suffix.encode('utf-8'))
+            return mask
+        
+        return self.filter(predicate)
     
     def __iter__(self) -> Iterator[Item]:
-        """迭代归档中的所有项目"""
+        """迭代归档中的所有项目（一次FFI调用批量获取全部项目信息）"""
         count = self.item_count
-        for i in range(count):
-            yield self.get_item_info(i)
+        if len(self._item_cache) < count:
+            infos = self._read_item_infos()
+            try:
+                # 已缓存的Item保持不变，保证同一索引始终返回同一对象
+                for i, info in enumerate(infos):
+                    if i not in self._item_cache:
+                        self._item_cache[i] = Item(info, self)
+            finally:
+                # 释放C分配的路径字符串
+                _sz_item_info_free_range(infos, len(infos))
+        items = [self._item_cache[i] for i in range(count)]
+        yield from items
     
     def __len__(self) -> int:
         return self.item_count
@@ -374,22 +770,15 @@ class Writer:
             Writer实例
         """
         writer = cls()
-        path_bytes = str(path).encode('utf-8')
+        path_bytes = os.fsencode(path)
         
         # 转换格式字符串
         if isinstance(format, str):
-            format_map = {
-                '7z': SzFormat.SEVEN_Z,
-                'sevenzip': SzFormat.SEVEN_Z,
-                'zip': SzFormat.ZIP,
-                'tar': SzFormat.TAR,
-                'gzip': SzFormat.GZIP,
-                'gz': SzFormat.GZIP,
-                'bzip2': SzFormat.BZIP2,
-                'bz2': SzFormat.BZIP2,
-                'xz': SzFormat.XZ,
-            }
-            format = format_map.get(format.lower(), SzFormat.SEVEN_Z)
+            # 常见的小写写法直接命中；仅在未命中时才分配小写副本
+            fmt = _FORMAT_MAP.get(format)
+            if fmt is None:
+                fmt = _FORMAT_MAP.get(format.lower(), SzFormat.SEVEN_Z)
+            format = fmt
         
         handle = sz_writer_handle()
         result = _lib.sz_writer_create(path_bytes, format, ctypes.byref(handle))
@@ -411,12 +800,41 @@ class Writer:
         if self._finalized:
             raise SevenZipError("归档已完成，不能添加更多文件")
         
-        file_path_bytes = str(file_path).encode('utf-8')
+        file_path_bytes = os.fsencode(file_path)
         archive_path_bytes = (archive_path or Path(file_path).name).encode('utf-8')
         
-        result = _lib.sz_writer_add_file(self._handle, file_path_bytes, archive_path_bytes)
+        result = _sz_writer_add_file(self._handle, file_path_bytes, archive_path_bytes)
         _check_result(result, "添加文件")
     
+    def add_files(self, file_paths: List[Union[str, Path]],
+                  archive_paths: Optional[List[str]] = None):
+        """
+        批量添加多个文件到归档（一次FFI调用）
+        
+        Args:
+            file_paths: 源文件路径列表
+            archive_paths: 与file_paths一一对应的归档内路径（默认使用文件名）
+        """
+        if not self._handle:
+            raise SevenZipError("写入器未初始化")
+        if self._finalized:
+            raise SevenZipError("归档已完成，不能添加更多文件")
+        
+        sources = [os.fsencode(path) for path in file_paths]
+        count = len(sources)
+        sources_array = (c_char_p * count)(*sources)
+        
+        if archive_paths is None:
+            # 传NULL：由C层按文件名命名，与add_file的默认行为一致
+            names_array = None
+        elif len(archive_paths) != count:
+            raise ValueError("archive_paths 与 file_paths 长度不一致")
+        else:
+            names_array = (c_char_p * count)(*[name.encode('utf-8') for name in archive_paths])
+        
+        result = _lib.sz_writer_add_files(self._handle, sources_array, names_array, count)
+        _check_result(result, "批量添加文件")
+    
     def add_directory(self, dir_path: Union[str, Path], recursive: bool = True):
         """
         添加目录到归档
@@ -430,16 +848,16 @@ class Writer:
         if self._finalized:
             raise SevenZipError("归档已完成，不能添加更多目录")
         
-        dir_path_bytes = str(dir_path).encode('utf-8')
+        dir_path_bytes = os.fsencode(dir_path)
         result = _lib.sz_writer_add_directory(self._handle, dir_path_bytes, int(recursive))
         _check_result(result, "添加目录")
     
-    def add_memory(self, data: bytes, archive_path: str):
+    def add_memory(self, data: Union[bytes, bytearray, memoryview], archive_path: str):
         """
         从内存添加数据到归档
         
         Args:
-            data: 字节数据
+            data: 支持缓冲区协议的对象（bytes、bytearray、memoryview、numpy数组、mmap等）
             archive_path: 归档中的文件路径
         """
         if not self._handle:
@@ -448,11 +866,9 @@ class Writer:
             raise SevenZipError("归档已完成，不能添加更多数据")
         
         archive_path_bytes = archive_path.encode('utf-8')
-        data_ptr = ctypes.cast(data, c_void_p)
+        buffer, size = _as_c_buffer(data)
         
-        result = _lib.sz_writer_add_memory(
-            self._handle, data_ptr, len(data), archive_path_bytes
-        )
+        result = _sz_writer_add_memory(self._handle, buffer, size, archive_path_bytes)
         _check_result(result, "添加内存数据")
     
     def set_password(self, password: str):
@@ -479,14 +895,7 @@ class Writer:
             raise SevenZipError("归档已完成，不能设置压缩级别")
         
         if isinstance(level, str):
-            level_map = {
-                'none': SzCompressionLevel.NONE,
-                'fast': SzCompressionLevel.FAST,
-                'normal': SzCompressionLevel.NORMAL,
-                'maximum': SzCompressionLevel.MAXIMUM,
-                'ultra': SzCompressionLevel.ULTRA,
-            }
-            level = level_map.get(level.lower(), SzCompressionLevel.NORMAL)
+            level = _LEVEL_MAP.get(level.lower(), SzCompressionLevel.NORMAL)
         
         result = _lib.sz_writer_set_compression_level(self._handle, level)
         _check_result(result, "设置压缩级别")
@@ -525,30 +934,51 @@ class Writer:
 
 def extract_archive(archive_path: Union[str, Path], 
                    output_dir: Union[str, Path],
-                   password: Optional[str] = None):
+                   password: Optional[str] = None,
+                   max_workers: Optional[int] = None):
     """
     提取整个归档到目录
     
+    非固实归档的各项目可独立解压，会分配到多个线程并行提取；
+    固实归档的项目共享压缩块，逐项提取会反复从头解压同一块，
+    因此（以及只用一个线程时）通过一次 extract 调用整体解压。
+    
     Args:
         archive_path: 归档文件路径
         output_dir: 输出目录
         password: 可选的密码
+        max_workers: 最大线程数（默认使用CPU核心数，1表示串行）
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     with Archive.open(archive_path, password) as archive:
-        for item in archive:
-            if item.is_directory:
-                continue
-            
-            # 提取文件
-            data = archive.extract_to_memory(item.index)
-            
-            # 写入文件
-            output_path = output_dir / item.path
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_bytes(data)
+        items = list(archive)
+        indices = [item.index for item in items if not item.is_directory]
+        directories = [item.path for item in items if item.is_directory]
+        workers = min(max_workers or os.cpu_count() or 1, len(indices))
+        
+        if workers <= 1 or archive.is_solid:
+            # 一次 sz_archive_extract_all：每个固实块只顺序解压一遍
+            archive.extract(output_dir)
+            return
+    
+    # 目录项无需解压，先创建好，使空目录与整体提取时一样被还原
+    for directory in directories:
+        (output_dir / directory).mkdir(parents=True, exist_ok=True)
+    
+    # 归档句柄不是线程安全的，每个线程打开独立的句柄；
+    # ctypes调用C函数期间会释放GIL，因此各线程的解压可以真正并行
+    def extract_chunk(chunk: List[int]):
+        with Archive.open(archive_path, password) as worker_archive:
+            for index in chunk:
+                worker_archive.extract_item(index, output_dir)
+    
+    chunks = [indices[i::workers] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(extract_chunk, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
 
 
 def create_archive(output_path: Union[str, Path],
@@ -572,12 +1002,19 @@ def create_archive(output_path: Union[str, Path],
         if password:
             writer.set_password(password)
         
+        # 连续的普通文件合并为一次add_files调用，遇到目录时先提交已收集的文件以保持顺序
+        pending: List[Path] = []
         for file_path in files:
             file_path = Path(file_path)
             if file_path.is_dir():
+                if pending:
+                    writer.add_files(pending)
+                    pending = []
                 writer.add_directory(file_path, recursive=True)
             else:
-                writer.add_file(file_path)
+                pending.append(file_path)
+        if pending:
+            writer.add_files(pending)
 
 
 __all__ = [
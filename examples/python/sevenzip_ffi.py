@@ -20,13 +20,27 @@ Example usage:
 """
 
 import ctypes
+import functools
+import itertools
 import os
 import platform
+import queue
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional, Callable, Any, Dict, List
 from enum import IntEnum
 
 
+def _open_library(path: str) -> ctypes.CDLL:
+    """Open the shared library with fixed loader flags."""
+    if platform.system() == 'Windows':
+        # Keep ctypes' default (secure) DLL search flags
+        return ctypes.CDLL(path)
+    # RTLD_NOW: resolve every symbol once at load time rather than lazily per first call
+    return ctypes.CDLL(path, mode=os.RTLD_NOW | os.RTLD_LOCAL)
+
+
 # Load the shared library
 def _load_library():
     """Load the sevenzip C library based on platform."""
@@ -51,11 +65,11 @@ def _load_library():
     for path in search_paths:
         lib_path = path / lib_name
         if lib_path.exists():
-            return ctypes.CDLL(str(lib_path))
+            return _open_library(str(lib_path))
     
     # Try loading from system path
     try:
-        return ctypes.CDLL(lib_name)
+        return _open_library(lib_name)
     except OSError:
         raise RuntimeError(f"Could not find {lib_name}. Please ensure the library is built and in your PATH.")
 
@@ -70,18 +84,24 @@ class SzResult(IntEnum):
     OK = 0
     FAIL = 1
     OUT_OF_MEMORY = 2
-    INVALID_ARGUMENT = 3
-    FILE_NOT_FOUND = 4
-    ACCESS_DENIED = 5
+    FILE_NOT_FOUND = 3
+    ACCESS_DENIED = 4
+    INVALID_ARGUMENT = 5
     UNSUPPORTED_FORMAT = 6
     CORRUPTED_ARCHIVE = 7
     WRONG_PASSWORD = 8
-    NOT_IMPLEMENTED = 9
-    ABORTED = 10
-    DISK_FULL = 11
-    INTERNAL_ERROR = 12
-    BUSY = 13
-    INVALID_STATE = 14
+    CANCELLED = 9
+    INDEX_OUT_OF_RANGE = 10
+    ALREADY_OPEN = 11
+    NOT_OPEN = 12
+    WRITE_ERROR = 13
+    READ_ERROR = 14
+    NOT_IMPLEMENTED = 15
+    DISK_FULL = 16
+
+
+# Plain-int copy of SzResult.OK for the per-call result check
+_SZ_OK = 0
 
 
 class SzFormat(IntEnum):
@@ -105,6 +125,20 @@ class SzCompressionLevel(IntEnum):
     ULTRA = 5
 
 
+# Lower-case name -> enum lookups for the string-typed public API
+_FORMAT_MAP = {name.lower(): value for name, value in SzFormat.__members__.items()}
+_FORMAT_MAP.update({'7z': SzFormat.SEVENZIP, 'gz': SzFormat.GZIP, 'bz2': SzFormat.BZIP2})
+_LEVEL_MAP = {name.lower(): value for name, value in SzCompressionLevel.__members__.items()}
+
+
+def _lookup_enum(mapping: Dict[str, IntEnum], name: str, kind: str) -> IntEnum:
+    """Resolve a case-insensitive format/level name, raising ValueError if unknown."""
+    try:
+        return mapping[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown {kind}: {name!r}") from None
+
+
 # Opaque handle types
 class _ArchiveHandle(ctypes.c_void_p):
     pass
@@ -146,6 +180,50 @@ class _SzItemInfo(ctypes.Structure):
     ]
 
 
+# Numeric item fields exposed by SevenZip.list_items_array (names match _SzItemInfo)
+_ITEM_ARRAY_FIELDS = [
+    ('index', f'u{ctypes.sizeof(ctypes.c_size_t)}'),
+    ('size', 'u8'),
+    ('packed_size', 'u8'),
+    ('crc', 'u4'),
+    ('has_crc', 'i4'),
+    ('creation_time', 'i8'),
+    ('modification_time', 'i8'),
+    ('is_directory', 'i4'),
+    ('is_encrypted', 'i4'),
+]
+
+
+def _item_array_dtypes(np):
+    """
+    Build the (raw_dtype, dtype) pair used by list_items_array.
+    
+    raw_dtype overlays a _SzItemInfo array in place using the ctypes field
+    offsets (skipping the path pointer); dtype is the packed result layout
+    with 'path' as an object column of undecoded bytes.
+    """
+    names = [name for name, _ in _ITEM_ARRAY_FIELDS]
+    raw_dtype = np.dtype({
+        'names': names,
+        'formats': [fmt for _, fmt in _ITEM_ARRAY_FIELDS],
+        'offsets': [getattr(_SzItemInfo, name).offset for name in names],
+        'itemsize': ctypes.sizeof(_SzItemInfo),
+    })
+    dtype = np.dtype(_ITEM_ARRAY_FIELDS[:1] + [('path', 'O')] + _ITEM_ARRAY_FIELDS[1:])
+    return raw_dtype, dtype
+
+
+def _build_items_array(np, item_infos: ctypes.Array):
+    """Build the list_items_array result from a batched _SzItemInfo array (does not free it)."""
+    raw_dtype, dtype = _item_array_dtypes(np)
+    raw = np.frombuffer(item_infos, dtype=raw_dtype)
+    items = np.empty(len(item_infos), dtype=dtype)
+    for name, _ in _ITEM_ARRAY_FIELDS:
+        items[name] = raw[name]
+    items['path'] = [item_info.path or b'' for item_info in item_infos]
+    return items
+
+
 # Callback types
 _ProgressCallback = ctypes.CFUNCTYPE(
     ctypes.c_int,  # return
@@ -154,6 +232,95 @@ _ProgressCallback = ctypes.CFUNCTYPE(
     ctypes.c_void_p  # user_data
 )
 
+# Ticks for every in-flight extraction, as (pump, tick) pairs; tick None closes the pump
+_pump_queue = queue.SimpleQueue()
+_pump_thread: Optional[threading.Thread] = None
+_pump_thread_lock = threading.Lock()
+
+
+def _pump_worker():
+    """Delivers queued progress ticks, in order, for all pumps."""
+    while True:
+        pump, tick = _pump_queue.get()
+        pump._deliver(tick)
+
+
+def _get_pump_thread() -> threading.Thread:
+    """Start the shared progress thread on first use and return it."""
+    global _pump_thread
+    with _pump_thread_lock:
+        if _pump_thread is None:
+            _pump_thread = threading.Thread(target=_pump_worker, name='sevenzip-progress', daemon=True)
+            _pump_thread.start()
+        return _pump_thread
+
+
+class _ProgressPump:
+    """
+    Runs a user progress callback on the shared progress thread.
+    
+    The C side only enqueues (completed, total) ticks, so the thread running
+    the extraction holds the GIL just long enough for a queue put. A callback
+    returning False (or raising) cancels the operation at the next tick; any
+    other return value, including None, continues. False on the final tick
+    (completed == total) is ignored, as there is nothing left to cancel.
+    """
+    
+    def __init__(self, callback: Callable[[int, int], bool]):
+        self._callback = callback
+        self._error: Optional[BaseException] = None
+        self._closed = threading.Event()
+        self.cancelled = False
+        # A callback that itself extracts with progress runs on the progress thread,
+        # which could then never deliver the nested ticks: run those inline instead
+        self._inline = threading.current_thread() is _get_pump_thread()
+    
+    def post(self, completed: int, total: int) -> int:
+        """Queue one tick; returns 0 once the consumer has requested cancellation."""
+        if self.cancelled:
+            return 0
+        if self._inline:
+            self._deliver((completed, total))
+            return 0 if self.cancelled else 1
+        _pump_queue.put((self, (completed, total)))
+        return 1
+    
+    def _deliver(self, tick):
+        if tick is None:
+            self._closed.set()
+            return
+        if self.cancelled:
+            return
+        completed, total = tick
+        try:
+            if self._callback(completed, total) is False and not 0 < total <= completed:
+                self.cancelled = True
+        except BaseException as e:
+            self._error = e
+            self.cancelled = True
+    
+    def close(self):
+        """Wait until every queued tick has been delivered and re-raise a callback error."""
+        if not self._inline:
+            _pump_queue.put((self, None))
+            self._closed.wait()
+        if self._error is not None:
+            raise self._error
+
+
+# Progress pumps for in-flight extractions, keyed by the user_data value
+_progress_pumps: Dict[int, _ProgressPump] = {}
+_progress_keys = itertools.count(1)
+
+
+@_ProgressCallback
+def _progress_trampoline(completed, total, user_data):
+    """Single C entry point for progress reports; dispatches on user_data."""
+    pump = _progress_pumps.get(user_data)
+    if pump is None:
+        return 1
+    return pump.post(completed, total)
+
 
 # Function declarations
 def _setup_functions():
@@ -195,12 +362,29 @@ def _setup_functions():
     _lib.sz_archive_get_item_info.argtypes = [_ArchiveHandle, ctypes.c_size_t, ctypes.POINTER(_SzItemInfo)]
     _lib.sz_archive_get_item_info.restype = ctypes.c_int
     
+    _lib.sz_archive_get_item_info_range.argtypes = [
+        _ArchiveHandle, ctypes.c_size_t, ctypes.c_size_t, ctypes.POINTER(_SzItemInfo)
+    ]
+    _lib.sz_archive_get_item_info_range.restype = ctypes.c_int
+    
     _lib.sz_item_info_free.argtypes = [ctypes.POINTER(_SzItemInfo)]
     _lib.sz_item_info_free.restype = None
     
+    _lib.sz_item_info_free_range.argtypes = [ctypes.POINTER(_SzItemInfo), ctypes.c_size_t]
+    _lib.sz_item_info_free_range.restype = None
+    
+    _lib.sz_archive_extract_to_memory.argtypes = [_ArchiveHandle, ctypes.c_size_t, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t)]
+    _lib.sz_archive_extract_to_memory.restype = ctypes.c_int
+    
+    _lib.sz_memory_free.argtypes = [ctypes.c_void_p]
+    _lib.sz_memory_free.restype = None
+    
     _lib.sz_archive_extract_all.argtypes = [_ArchiveHandle, ctypes.c_char_p, _ProgressCallback, ctypes.c_void_p]
     _lib.sz_archive_extract_all.restype = ctypes.c_int
     
+    _lib.sz_archive_set_progress_interval.argtypes = [_ArchiveHandle, ctypes.c_uint64]
+    _lib.sz_archive_set_progress_interval.restype = ctypes.c_int
+    
     _lib.sz_archive_set_password.argtypes = [_ArchiveHandle, ctypes.c_char_p]
     _lib.sz_archive_set_password.restype = ctypes.c_int
     
@@ -208,13 +392,13 @@ def _setup_functions():
     _lib.sz_writer_create.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.POINTER(_WriterHandle)]
     _lib.sz_writer_create.restype = ctypes.c_int
     
-    _lib.sz_writer_destroy.argtypes = [_WriterHandle]
-    _lib.sz_writer_destroy.restype = None
+    _lib.sz_writer_cancel.argtypes = [_WriterHandle]
+    _lib.sz_writer_cancel.restype = None
     
     _lib.sz_writer_add_file.argtypes = [_WriterHandle, ctypes.c_char_p, ctypes.c_char_p]
     _lib.sz_writer_add_file.restype = ctypes.c_int
     
-    _lib.sz_writer_add_directory.argtypes = [_WriterHandle, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    _lib.sz_writer_add_directory.argtypes = [_WriterHandle, ctypes.c_char_p, ctypes.c_int]
     _lib.sz_writer_add_directory.restype = ctypes.c_int
     
     _lib.sz_writer_set_compression_level.argtypes = [_WriterHandle, ctypes.c_int]
@@ -236,6 +420,19 @@ def _setup_functions():
 
 _setup_functions()
 
+# Pre-bound functions used on the archive read paths (module globals instead of
+# a CDLL attribute lookup per call). Output parameters can be passed as ctypes
+# instances directly: ctypes takes their address for POINTER argtypes.
+_sz_archive_open = _lib.sz_archive_open
+_sz_archive_close = _lib.sz_archive_close
+_sz_archive_set_password = _lib.sz_archive_set_password
+_sz_archive_get_info = _lib.sz_archive_get_info
+_sz_archive_get_item_count = _lib.sz_archive_get_item_count
+_sz_archive_get_item_info_range = _lib.sz_archive_get_item_info_range
+_sz_item_info_free_range = _lib.sz_item_info_free_range
+_sz_archive_extract_to_memory = _lib.sz_archive_extract_to_memory
+_sz_memory_free = _lib.sz_memory_free
+
 
 # Exception class
 class SevenZipError(Exception):
@@ -243,39 +440,139 @@ class SevenZipError(Exception):
     
     def __init__(self, result: SzResult, message: Optional[str] = None):
         self.result = result
-        if message is None:
-            message = _lib.sz_error_to_string(result).decode('utf-8')
-            detail = _lib.sz_get_last_error_message().decode('utf-8')
-            if detail:
-                message = f"{message}: {detail}"
-        super().__init__(message)
+        self._message = message
+        # The detail lives in thread-local C storage that the next call on this
+        # thread overwrites, so only the raw bytes are captured here; looking up
+        # the code's text and decoding are deferred until the message is used.
+        self._detail = _lib.sz_get_last_error_message() if message is None else None
+        super().__init__()
+    
+    def __str__(self) -> str:
+        if self._message is None:
+            message = _lib.sz_error_to_string(self.result).decode('utf-8')
+            if self._detail:
+                message = f"{message}: {self._detail.decode('utf-8', 'replace')}"
+            self._message = message
+        return self._message
+    
+    @property
+    def args(self):
+        # Same (message,) tuple as before formatting became lazy; built on first access
+        return (str(self),)
+    
+    @args.setter
+    def args(self, value):
+        self._message = str(value[0]) if value else ''
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+    
+    def __reduce__(self):
+        # Pass the formatted message so unpickling does not read the (by then
+        # unrelated) thread-local error detail again
+        return type(self), (self.result, str(self))
 
 
 def _check_result(result: int):
     """Check result code and raise exception if error."""
-    if result != SzResult.OK:
+    if result != _SZ_OK:
         raise SevenZipError(SzResult(result))
 
 
+def _item_to_dict(item_info: _SzItemInfo, path: str) -> Dict[str, Any]:
+    """Convert one item info struct (with its already decoded path) to the list_items dict."""
+    return {
+        'index': item_info.index,
+        'path': path,
+        'size': item_info.size,
+        'packed_size': item_info.packed_size,
+        'crc': item_info.crc if item_info.has_crc else None,
+        'is_directory': bool(item_info.is_directory),
+        'is_encrypted': bool(item_info.is_encrypted),
+    }
+
+
+def _item_infos_to_dicts(item_infos: ctypes.Array) -> List[Dict[str, Any]]:
+    """Build the list_items result from a batched _SzItemInfo array (does not free it)."""
+    # Paths cannot contain NUL: join the raw bytes, decode once, then split
+    paths = b'\0'.join([item_info.path or b'' for item_info in item_infos])
+    return list(map(_item_to_dict, item_infos, paths.decode('utf-8').split('\0')))
+
+
+_scratch_local = threading.local()
+
+
+def _scratch():
+    """
+    Per-thread reusable output structs (and their byref wrappers).
+    
+    Results must be copied out before the next call on the same thread.
+    """
+    scratch = _scratch_local
+    if not hasattr(scratch, 'count'):
+        scratch.archive_info = _SzArchiveInfo()
+        scratch.archive_info_ref = ctypes.byref(scratch.archive_info)
+        scratch.count = ctypes.c_size_t()
+        scratch.count_ref = ctypes.byref(scratch.count)
+    return scratch
+
+
+def _to_c_path(path) -> bytes:
+    """Convert a str/bytes/PathLike path to an absolute, filesystem-encoded C string."""
+    return os.fsencode(os.path.abspath(path))
+
+
+def _convert_item_infos(archive_path: bytes, convert: Callable[[ctypes.Array], Any]) -> Any:
+    """
+    Open an archive, fetch every item's info in a single call and return convert(item_infos).
+    
+    The C-allocated path strings are freed and the archive is closed whether or
+    not the fetch or the conversion succeeds, so convert must copy out what it keeps.
+    """
+    handle = _ArchiveHandle()
+    result = _sz_archive_open(archive_path, ctypes.byref(handle))
+    _check_result(result)
+    
+    try:
+        scratch = _scratch()
+        result = _sz_archive_get_item_count(handle, scratch.count_ref)
+        _check_result(result)
+        
+        n = scratch.count.value
+        item_infos = (_SzItemInfo * n)()
+        try:
+            if n:
+                result = _sz_archive_get_item_info_range(handle, 0, n, item_infos)
+                _check_result(result)
+            return convert(item_infos)
+        finally:
+            _sz_item_info_free_range(item_infos, n)
+    finally:
+        _sz_archive_close(handle)
+
+
 # High-level Python API
 class SevenZip:
     """High-level interface to SevenZip library."""
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def get_version() -> str:
-        """Get library version string."""
+        """Get library version string (constant for the process, so cached)."""
         return _lib.sz_version_string().decode('utf-8')
     
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_format_supported(format: str) -> bool:
-        """Check if a format is supported."""
-        format_enum = getattr(SzFormat, format.upper(), None)
+        """Check if a format is supported (answers are cached per format name)."""
+        format_enum = _FORMAT_MAP.get(format.lower())
         if format_enum is None:
             return False
         return _lib.sz_is_format_supported(format_enum) != 0
     
     def extract(self, archive_path: str, dest_dir: str, password: Optional[str] = None,
-                progress_callback: Optional[Callable[[int, int], bool]] = None):
+                progress_callback: Optional[Callable[[int, int], bool]] = None,
+                progress_interval: int = 4 << 20):
         """
         Extract an archive to a directory.
         
@@ -283,13 +580,23 @@ class SevenZip:
             archive_path: Path to the archive file
             dest_dir: Destination directory
             password: Optional password for encrypted archives
-            progress_callback: Optional callback(completed, total) -> bool (return False to cancel)
+            progress_callback: Optional callback(completed, total) -> bool (return False to cancel;
+                any other value, including None, continues). Runs on a separate thread, so
+                cancellation takes effect at the next progress tick. Returning False on the
+                final tick (completed == total) is ignored.
+            progress_interval: Minimum number of bytes between two progress callbacks
+                (0 reports every tick; completion is always reported)
+        
+        Raises:
+            SevenZipError: With SzResult.CANCELLED if the progress callback cancelled. If the
+                cancel only reached the progress thread after the library had written the
+                last item, the error is still raised but the extracted output is complete.
         """
-        archive_path = str(Path(archive_path).absolute()).encode('utf-8')
-        dest_dir = str(Path(dest_dir).absolute()).encode('utf-8')
+        archive_path = _to_c_path(archive_path)
+        dest_dir = _to_c_path(dest_dir)
         
         handle = _ArchiveHandle()
-        result = _lib.sz_archive_open(archive_path, ctypes.byref(handle))
+        result = _sz_archive_open(archive_path, ctypes.byref(handle))
         _check_result(result)
         
         try:
@@ -298,15 +605,30 @@ class SevenZip:
                 _check_result(result)
             
             callback = None
+            user_data = None
             if progress_callback:
-                def wrapper(completed, total, user_data):
-                    return 1 if progress_callback(completed, total) else 0
-                callback = _ProgressCallback(wrapper)
+                result = _lib.sz_archive_set_progress_interval(handle, progress_interval)
+                _check_result(result)
+                
+                user_data = next(_progress_keys)
+                _progress_pumps[user_data] = _ProgressPump(progress_callback)
+                callback = _progress_trampoline
             
-            result = _lib.sz_archive_extract_all(handle, dest_dir, callback, None)
+            pump = None
+            try:
+                result = _lib.sz_archive_extract_all(handle, dest_dir, callback, user_data)
+            finally:
+                if user_data is not None:
+                    # Every tick has been delivered once close() returns
+                    pump = _progress_pumps.pop(user_data)
+                    pump.close()
             _check_result(result)
+            # A cancel requested while the last ticks were still queued arrives too
+            # late for the C side to see it, so report it here (the output is complete)
+            if pump is not None and pump.cancelled:
+                raise SevenZipError(SzResult.CANCELLED, "Operation cancelled by progress callback")
         finally:
-            _lib.sz_archive_close(handle)
+            _sz_archive_close(handle)
     
     def compress(self, source_path: str, archive_path: str, format: str = "7z",
                  level: str = "normal", password: Optional[str] = None):
@@ -320,10 +642,10 @@ class SevenZip:
             level: Compression level (store, fastest, fast, normal, maximum, ultra)
             password: Optional password for encryption
         """
-        source_path = str(Path(source_path).absolute()).encode('utf-8')
-        archive_path = str(Path(archive_path).absolute()).encode('utf-8')
-        format_enum = getattr(SzFormat, format.upper())
-        level_enum = getattr(SzCompressionLevel, level.upper())
+        source_path = _to_c_path(source_path)
+        archive_path = _to_c_path(archive_path)
+        format_enum = _lookup_enum(_FORMAT_MAP, format, 'format')
+        level_enum = _lookup_enum(_LEVEL_MAP, level, 'compression level')
         
         handle = _WriterHandle()
         result = _lib.sz_writer_create(archive_path, format_enum, ctypes.byref(handle))
@@ -337,9 +659,9 @@ class SevenZip:
                 result = _lib.sz_writer_set_password(handle, password.encode('utf-8'))
                 _check_result(result)
             
-            source = Path(source_path.decode('utf-8'))
-            if source.is_dir():
-                result = _lib.sz_writer_add_directory(handle, source_path, None, 1)
+            if os.path.isdir(source_path):
+                # The C writer walks the tree itself: one FFI call for the whole directory
+                result = _lib.sz_writer_add_directory(handle, source_path, 1)
             else:
                 result = _lib.sz_writer_add_file(handle, source_path, None)
             _check_result(result)
@@ -347,7 +669,7 @@ class SevenZip:
             result = _lib.sz_writer_finalize(handle)
             _check_result(result)
         finally:
-            _lib.sz_writer_destroy(handle)
+            _lib.sz_writer_cancel(handle)
     
     def get_archive_info(self, archive_path: str) -> Dict[str, Any]:
         """
@@ -356,15 +678,16 @@ class SevenZip:
         Returns:
             Dictionary with archive information
         """
-        archive_path = str(Path(archive_path).absolute()).encode('utf-8')
+        archive_path = _to_c_path(archive_path)
         
         handle = _ArchiveHandle()
-        result = _lib.sz_archive_open(archive_path, ctypes.byref(handle))
+        result = _sz_archive_open(archive_path, ctypes.byref(handle))
         _check_result(result)
         
         try:
-            info = _SzArchiveInfo()
-            result = _lib.sz_archive_get_info(handle, ctypes.byref(info))
+            scratch = _scratch()
+            info = scratch.archive_info
+            result = _sz_archive_get_info(handle, scratch.archive_info_ref)
             _check_result(result)
             
             return {
@@ -378,7 +701,7 @@ class SevenZip:
                 'has_encrypted_headers': bool(info.has_encrypted_headers),
             }
         finally:
-            _lib.sz_archive_close(handle)
+            _sz_archive_close(handle)
     
     def list_items(self, archive_path: str) -> List[Dict[str, Any]]:
         """
@@ -387,57 +710,81 @@ class SevenZip:
         Returns:
             List of dictionaries with item information
         """
-        archive_path = str(Path(archive_path).absolute()).encode('utf-8')
+        return _convert_item_infos(_to_c_path(archive_path), _item_infos_to_dicts)
+    
+    def list_items_array(self, archive_path: str):
+        """
+        List all items in an archive as a NumPy structured array (requires numpy).
+        
+        Numeric columns are copied straight out of the batched C item array
+        without building a dict per item. The 'path' column holds undecoded
+        UTF-8 bytes; 'crc' is only meaningful where 'has_crc' is non-zero.
+        
+        Returns:
+            numpy.ndarray with one record per item
+        """
+        import numpy as np
+        
+        return _convert_item_infos(_to_c_path(archive_path), functools.partial(_build_items_array, np))
+    
+    def extract_to_memoryview(self, archive_path: str, index: int,
+                              password: Optional[str] = None) -> memoryview:
+        """
+        Extract a single item into memory without copying it into a bytes object.
+        
+        The returned read-only memoryview wraps the C-allocated buffer directly;
+        the buffer is freed once the view (and any view derived from it) has
+        been garbage collected. Use bytes(view) if an owned copy is needed.
+        
+        Args:
+            archive_path: Path to the archive file
+            index: Index of the item to extract
+            password: Optional password for encrypted archives
+        """
+        archive_path = _to_c_path(archive_path)
         
         handle = _ArchiveHandle()
-        result = _lib.sz_archive_open(archive_path, ctypes.byref(handle))
+        result = _sz_archive_open(archive_path, handle)
         _check_result(result)
         
         try:
-            count = ctypes.c_size_t()
-            result = _lib.sz_archive_get_item_count(handle, ctypes.byref(count))
-            _check_result(result)
-            
-            items = []
-            for i in range(count.value):
-                item_info = _SzItemInfo()
-                result = _lib.sz_archive_get_item_info(handle, i, ctypes.byref(item_info))
+            if password:
+                result = _sz_archive_set_password(handle, password.encode('utf-8'))
                 _check_result(result)
-                
-                try:
-                    items.append({
-                        'index': item_info.index,
-                        'path': item_info.path.decode('utf-8'),
-                        'size': item_info.size,
-                        'packed_size': item_info.packed_size,
-                        'crc': item_info.crc if item_info.has_crc else None,
-                        'is_directory': bool(item_info.is_directory),
-                        'is_encrypted': bool(item_info.is_encrypted),
-                    })
-                finally:
-                    _lib.sz_item_info_free(ctypes.byref(item_info))
             
-            return items
+            data = ctypes.c_void_p()
+            size = ctypes.c_size_t()
+            result = _sz_archive_extract_to_memory(handle, index, data, size)
+            _check_result(result)
         finally:
-            _lib.sz_archive_close(handle)
+            _sz_archive_close(handle)
+        
+        # The buffer is independent of the archive handle, so it outlives the close above
+        if not size.value:
+            _sz_memory_free(data)
+            return memoryview(b'')
+        
+        buffer = (ctypes.c_char * size.value).from_address(data.value)
+        weakref.finalize(buffer, _sz_memory_free, data.value)
+        return memoryview(buffer).cast('B').toreadonly()
 
 
 # Simple convenience functions
 def extract(archive_path: str, dest_dir: str):
     """Simple extraction function."""
     result = _lib.sz_extract_simple(
-        str(Path(archive_path).absolute()).encode('utf-8'),
-        str(Path(dest_dir).absolute()).encode('utf-8')
+        _to_c_path(archive_path),
+        _to_c_path(dest_dir)
     )
     _check_result(result)
 
 
 def compress(source_path: str, archive_path: str, format: str = "7z"):
     """Simple compression function."""
-    format_enum = getattr(SzFormat, format.upper())
+    format_enum = _lookup_enum(_FORMAT_MAP, format, 'format')
     result = _lib.sz_compress_simple(
-        str(Path(source_path).absolute()).encode('utf-8'),
-        str(Path(archive_path).absolute()).encode('utf-8'),
+        _to_c_path(source_path),
+        _to_c_path(archive_path),
         format_enum
     )
     _check_result(result)
@@ -231,8 +231,9 @@ class Archive {
     Archive& withMultiVolume(uint64_t volumeSize);
 
     /// 设置进度回调
-    /// @param callback 进度回调函数
+    /// @param callback 进度回调函数（返回 false 取消操作）
     /// @return *this 用于链式调用
+    /// @note 创建模式下报告压缩进度，打开模式下报告解压进度
     Archive& withProgress(ProgressCallback callback);
 
     /// 完成压缩操作
@@ -298,6 +299,12 @@ class Archive {
     /// @return 如果归档完整返回true
     bool test() const;
 
+    /// 以测试模式解码单个项目（不输出数据），由解码器校验数据和CRC
+    /// @param index 项目索引
+    /// @return 数据完整返回true，数据或CRC错误返回false
+    /// @throws Exception 如果索引无效或测试因其他原因失败
+    bool testItem(size_t index) const;
+
     /// 检查是否已打开
     /// @return 如果已打开返回true
     bool isOpen() const;
@@ -93,6 +93,12 @@ class ArchiveReader {
     /// @return 如果归档完整返回true
     bool test() const;
 
+    /// @brief 以测试模式解码单个条目，由解码器校验数据和CRC
+    /// @param index 条目索引
+    /// @return 数据完整返回true，数据或CRC错误返回false
+    /// @throws Exception 如果索引无效或测试因其他原因失败
+    bool testItem(size_t index) const;
+
     // ========================================================================
     // 配置
     // ========================================================================
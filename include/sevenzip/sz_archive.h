@@ -84,6 +84,21 @@ SZ_API sz_result sz_archive_get_item_count(sz_archive_handle handle, size_t* out
 SZ_API sz_result sz_archive_get_item_info(sz_archive_handle handle, size_t index,
                                           sz_item_info* out_info);
 
+/**
+ * @brief Get information about a contiguous range of items in one call
+ *
+ * @param handle Archive handle
+ * @param start Index of the first item (0-based)
+ * @param count Number of items to retrieve
+ * @param out_infos Caller-allocated array of at least @p count entries
+ * @return SZ_OK on success, error code otherwise
+ *
+ * @note Call sz_item_info_free_range() to free the path strings when done.
+ *       On failure no strings are left allocated.
+ */
+SZ_API sz_result sz_archive_get_item_info_range(sz_archive_handle handle, size_t start,
+                                                size_t count, sz_item_info* out_infos);
+
 /**
  * @brief Free strings allocated in sz_item_info
  *
@@ -91,6 +106,14 @@ SZ_API sz_result sz_archive_get_item_info(sz_archive_handle handle, size_t index
  */
 SZ_API void sz_item_info_free(sz_item_info* info);
 
+/**
+ * @brief Free strings allocated in an array of sz_item_info
+ *
+ * @param infos Pointer to the first item info structure (NULL is allowed)
+ * @param count Number of entries in the array
+ */
+SZ_API void sz_item_info_free_range(sz_item_info* infos, size_t count);
+
 /* ============================================================================
  * Extraction Operations
  * ========================================================================= */
@@ -102,11 +125,26 @@ SZ_API void sz_item_info_free(sz_item_info* info);
  * @param dest_dir Destination directory (UTF-8)
  * @param progress Progress callback (optional, can be NULL)
  * @param user_data User data passed to callback
- * @return SZ_OK on success, error code otherwise
+ * @return SZ_OK on success, SZ_E_CANCELLED if the callback returned zero,
+ *         error code otherwise
+ *
+ * @note The callback is only used for the duration of this call
  */
 SZ_API sz_result sz_archive_extract_all(sz_archive_handle handle, const char* dest_dir,
                                         sz_progress_callback progress, void* user_data);
 
+/**
+ * @brief Limit how often the extraction progress callback is invoked
+ *
+ * @param handle Archive handle
+ * @param bytes Minimum number of processed bytes between two callbacks
+ *              (0 reports every progress tick; completion is always reported)
+ * @return SZ_OK on success, error code otherwise
+ *
+ * @note Applies to subsequent sz_archive_extract_all() calls
+ */
+SZ_API sz_result sz_archive_set_progress_interval(sz_archive_handle handle, uint64_t bytes);
+
 /**
  * @brief Extract a single item to a file
  *
@@ -132,6 +170,19 @@ SZ_API sz_result sz_archive_extract_item(sz_archive_handle handle, size_t index,
 SZ_API sz_result sz_archive_extract_to_memory(sz_archive_handle handle, size_t index,
                                               void** out_data, size_t* out_size);
 
+/**
+ * @brief Verify an item's data against its stored CRC32
+ *
+ * @param handle Archive handle
+ * @param index Item index to verify
+ * @param out_valid Pointer to receive 1 if the data is intact, 0 on a CRC or data error
+ * @return SZ_OK on success, error code otherwise
+ *
+ * @note The item is decoded in test mode (no output is produced) and checked by the
+ *       decoder; fails with SZ_E_INVALID_ARGUMENT if the item has no stored CRC
+ */
+SZ_API sz_result sz_archive_verify_crc(sz_archive_handle handle, size_t index, int* out_valid);
+
 /**
  * @brief Free memory allocated by the library
  *
@@ -130,6 +130,21 @@ SZ_API sz_result sz_writer_set_progress_callback(sz_writer_handle handle,
 SZ_API sz_result sz_writer_add_file(sz_writer_handle handle, const char* file_path,
                                     const char* archive_path);
 
+/**
+ * @brief Add several files to the archive in one call
+ *
+ * @param handle Writer handle
+ * @param file_paths Array of @p count source file paths (UTF-8)
+ * @param archive_paths Array of @p count paths in archive (UTF-8), or NULL to use the
+ *                      file names; individual entries may also be NULL
+ * @param count Number of files to add
+ * @return SZ_OK on success, error code otherwise
+ *
+ * @note On failure, the files preceding the failing entry remain added
+ */
+SZ_API sz_result sz_writer_add_files(sz_writer_handle handle, const char* const* file_paths,
+                                     const char* const* archive_paths, size_t count);
+
 /**
  * @brief Add a directory to the archive
  *
@@ -339,6 +339,13 @@ Archive& Archive::withMultiVolume(uint64_t volumeSize) {
 }
 
 Archive& Archive::withProgress(ProgressCallback callback) {
+    if (impl_->mode == Impl::Mode::Open) {
+        // 打开模式：交给读取器，由解压回调在 SetCompleted 中上报进度（传空回调即清除）
+        impl_->progressCallback = std::move(callback);
+        impl_->reader->setProgressCallback(impl_->progressCallback);
+        return *this;
+    }
+
     impl_->ensureCreateMode();
     impl_->progressCallback = std::move(callback);
 
@@ -497,6 +504,16 @@ bool Archive::test() const {
     }
 }
 
+bool Archive::testItem(size_t index) const {
+    impl_->ensureOpenMode();
+
+    try {
+        return impl_->reader->testItem(static_cast<uint32_t>(index));
+    } catch (const Exception& e) {
+        throw Exception(e.code(), std::string("Failed to test item: ") + e.what());
+    }
+}
+
 bool Archive::isOpen() const {
     if (impl_->mode == Impl::Mode::Open && impl_->reader) {
         return impl_->reader->isOpen();
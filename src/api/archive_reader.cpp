@@ -79,17 +79,18 @@ bool ArchiveReader::test() const {
     return impl_->archive.test();
 }
 
+bool ArchiveReader::testItem(size_t index) const {
+    return impl_->archive.testItem(index);
+}
+
 ArchiveReader& ArchiveReader::withPassword(const std::string& password) {
     impl_->archive.withPassword(password);
     return *this;
 }
 
 ArchiveReader& ArchiveReader::withProgress(ProgressCallback callback) {
-    // ArchiveReader uses Archive in Open mode, so we can't use Archive::withProgress
-    // Instead, we need to set the callback directly on the reader
-    // For now, this is a no-op since the underlying reader doesn't expose progress callbacks
-    // TODO: Implement progress callback support in Archive's Open mode
-    (void)callback;  // Suppress unused parameter warning
+    // Archive forwards the callback to the underlying reader in Open mode
+    impl_->archive.withProgress(std::move(callback));
     return *this;
 }
 
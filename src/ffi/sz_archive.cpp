@@ -4,6 +4,7 @@
 
 #include <cstring>
 #include <memory>
+#include <string>
 
 #include "sevenzip/archive_reader.hpp"
 #include "sz_error_internal.h"
@@ -11,8 +12,29 @@
 // Opaque handle structure
 struct sz_archive_s {
     std::unique_ptr<sevenzip::ArchiveReader> reader;
+    uint64_t progress_interval = 0;  // Minimum bytes between progress callbacks
 };
 
+// Fill a C item info structure from the C++ item info
+static void fill_item_info(const sevenzip::ItemInfo& info, sz_item_info* out_info) {
+    out_info->index = info.index;
+    out_info->path = _strdup(info.path.string().c_str());  // Allocate copy
+    out_info->size = info.size;
+    out_info->packed_size = info.packedSize;
+    out_info->crc = info.crc.value_or(0);
+    out_info->has_crc = info.crc.has_value() ? 1 : 0;
+
+    // Convert time_point to Unix timestamp
+    auto to_unix_time = [](const std::chrono::system_clock::time_point& tp) {
+        return std::chrono::duration_cast<std::chrono::seconds>(tp.time_since_epoch()).count();
+    };
+
+    out_info->creation_time = to_unix_time(info.creationTime);
+    out_info->modification_time = to_unix_time(info.modificationTime);
+    out_info->is_directory = info.isDirectory ? 1 : 0;
+    out_info->is_encrypted = info.isEncrypted ? 1 : 0;
+}
+
 extern "C" {
 
 sz_result sz_archive_open(const char* path, sz_archive_handle* out_handle) {
@@ -121,24 +143,38 @@ sz_result sz_archive_get_item_info(sz_archive_handle handle, size_t index, sz_it
     }
 
     SZ_TRY_CATCH_BEGIN
-    auto info = handle->reader->itemInfo(index);
+    fill_item_info(handle->reader->itemInfo(index), out_info);
 
-    out_info->index = info.index;
-    out_info->path = _strdup(info.path.string().c_str());  // Allocate copy
-    out_info->size = info.size;
-    out_info->packed_size = info.packedSize;
-    out_info->crc = info.crc.value_or(0);
-    out_info->has_crc = info.crc.has_value() ? 1 : 0;
+    sz_clear_error();
+    return SZ_OK;
+    SZ_TRY_CATCH_END(SZ_E_FAIL)
+}
 
-    // Convert time_point to Unix timestamp
-    auto to_unix_time = [](const std::chrono::system_clock::time_point& tp) {
-        return std::chrono::duration_cast<std::chrono::seconds>(tp.time_since_epoch()).count();
-    };
+sz_result sz_archive_get_item_info_range(sz_archive_handle handle, size_t start, size_t count,
+                                         sz_item_info* out_infos) {
+    if (!handle || (!out_infos && count > 0)) {
+        sz_set_last_error("Invalid argument: NULL pointer");
+        return SZ_E_INVALID_ARGUMENT;
+    }
 
-    out_info->creation_time = to_unix_time(info.creationTime);
-    out_info->modification_time = to_unix_time(info.modificationTime);
-    out_info->is_directory = info.isDirectory ? 1 : 0;
-    out_info->is_encrypted = info.isEncrypted ? 1 : 0;
+    SZ_TRY_CATCH_BEGIN
+    size_t item_count = handle->reader->itemCount();
+    if (start > item_count || count > item_count - start) {
+        sz_set_last_error("Item range out of range");
+        return SZ_E_INDEX_OUT_OF_RANGE;
+    }
+
+    std::memset(out_infos, 0, count * sizeof(sz_item_info));
+    size_t filled = 0;
+    try {
+        for (; filled < count; ++filled) {
+            fill_item_info(handle->reader->itemInfo(start + filled), &out_infos[filled]);
+        }
+    } catch (...) {
+        // Release the paths already allocated before propagating the error
+        sz_item_info_free_range(out_infos, filled);
+        throw;
+    }
 
     sz_clear_error();
     return SZ_OK;
@@ -152,6 +188,15 @@ void sz_item_info_free(sz_item_info* info) {
     }
 }
 
+void sz_item_info_free_range(sz_item_info* infos, size_t count) {
+    if (!infos) {
+        return;
+    }
+    for (size_t i = 0; i < count; ++i) {
+        sz_item_info_free(&infos[i]);
+    }
+}
+
 sz_result sz_archive_extract_all(sz_archive_handle handle, const char* dest_dir,
                                  sz_progress_callback progress, void* user_data) {
     if (!handle || !dest_dir) {
@@ -161,18 +206,57 @@ sz_result sz_archive_extract_all(sz_archive_handle handle, const char* dest_dir,
 
     SZ_TRY_CATCH_BEGIN
     // Set up progress callback if provided
+    bool cancelled = false;
     if (progress) {
-        handle->reader->withProgress([progress, user_data](uint64_t completed, uint64_t total) {
-            return progress(completed, total, user_data) != 0;
-        });
+        // Throttle: only call back once at least progress_interval bytes were processed
+        // since the last report; completion is always reported
+        handle->reader->withProgress(
+            [progress, user_data, &cancelled, interval = handle->progress_interval,
+             last_reported = uint64_t{0}](uint64_t completed, uint64_t total) mutable {
+                if (completed < total && completed >= last_reported &&
+                    completed - last_reported < interval) {
+                    return true;
+                }
+                last_reported = completed;
+                if (progress(completed, total, user_data) == 0) {
+                    cancelled = true;
+                    return false;
+                }
+                return true;
+            });
     }
 
-    handle->reader->extractAll(dest_dir);
+    // The callback and user_data are only valid for this call: uninstall it on every exit path
+    struct ProgressReset {
+        sevenzip::ArchiveReader& reader;
+        ~ProgressReset() { reader.withProgress(nullptr); }
+    } reset{*handle->reader};
+
+    try {
+        handle->reader->extractAll(dest_dir);
+    } catch (...) {
+        if (cancelled) {
+            sz_set_last_error("Operation cancelled by progress callback");
+            return SZ_E_CANCELLED;
+        }
+        throw;
+    }
     sz_clear_error();
     return SZ_OK;
     SZ_TRY_CATCH_END(SZ_E_FAIL)
 }
 
+sz_result sz_archive_set_progress_interval(sz_archive_handle handle, uint64_t bytes) {
+    if (!handle) {
+        sz_set_last_error("Invalid argument: NULL pointer");
+        return SZ_E_INVALID_ARGUMENT;
+    }
+
+    handle->progress_interval = bytes;
+    sz_clear_error();
+    return SZ_OK;
+}
+
 sz_result sz_archive_extract_item(sz_archive_handle handle, size_t index, const char* dest_path) {
     if (!handle || !dest_path) {
         sz_set_last_error("Invalid argument: NULL pointer");
@@ -212,6 +296,27 @@ sz_result sz_archive_extract_to_memory(sz_archive_handle handle, size_t index, v
     SZ_TRY_CATCH_END(SZ_E_FAIL)
 }
 
+sz_result sz_archive_verify_crc(sz_archive_handle handle, size_t index, int* out_valid) {
+    if (!handle || !out_valid) {
+        sz_set_last_error("Invalid argument: NULL pointer");
+        return SZ_E_INVALID_ARGUMENT;
+    }
+
+    SZ_TRY_CATCH_BEGIN
+    auto info = handle->reader->itemInfo(index);
+    if (!info.crc.has_value()) {
+        sz_set_last_error("Item has no stored CRC");
+        return SZ_E_INVALID_ARGUMENT;
+    }
+
+    // Decode in test mode: the decoder checks the stored CRC itself and nothing is materialised
+    *out_valid = handle->reader->testItem(index) ? 1 : 0;
+
+    sz_clear_error();
+    return SZ_OK;
+    SZ_TRY_CATCH_END(SZ_E_FAIL)
+}
+
 void sz_memory_free(void* data) {
     if (data) {
         free(data);
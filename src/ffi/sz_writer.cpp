@@ -308,6 +308,38 @@ SZ_API sz_result sz_writer_add_file(sz_writer_handle handle, const char* file_pa
     SZ_TRY_CATCH_END(SZ_E_FAIL)
 }
 
+SZ_API sz_result sz_writer_add_files(sz_writer_handle handle, const char* const* file_paths,
+                                     const char* const* archive_paths, size_t count) {
+    if (!handle || (!file_paths && count > 0)) {
+        sz_set_last_error("Invalid argument: handle and file_paths must not be NULL");
+        return SZ_E_INVALID_ARGUMENT;
+    }
+
+    SZ_TRY_CATCH_BEGIN
+    auto writer = reinterpret_cast<SzWriter*>(handle);
+
+    if (writer->finalized) {
+        sz_set_last_error("Cannot add files to finalized archive");
+        return SZ_E_FAIL;
+    }
+
+    for (size_t i = 0; i < count; ++i) {
+        if (!file_paths[i]) {
+            sz_set_last_error("Invalid argument: file path must not be NULL");
+            return SZ_E_INVALID_ARGUMENT;
+        }
+
+        const char* archive_path = archive_paths ? archive_paths[i] : nullptr;
+        if (archive_path) {
+            writer->writer->addFile(file_paths[i], archive_path);
+        } else {
+            writer->writer->addFile(file_paths[i]);
+        }
+    }
+    return SZ_OK;
+    SZ_TRY_CATCH_END(SZ_E_FAIL)
+}
+
 SZ_API sz_result sz_writer_add_directory(sz_writer_handle handle, const char* dir_path,
                                          int recursive) {
     if (!handle || !dir_path) {
@@ -599,6 +599,52 @@ bool ArchiveReader::testArchive() {
     return SUCCEEDED(hr);
 }
 
+bool ArchiveReader::testItem(uint32_t index) {
+    if (!impl_->isOpen) {
+        throw Exception(ErrorCode::InvalidHandle, "Archive not open");
+    }
+
+    // 检查索引有效性
+    uint32_t itemCount = getItemCount();
+    if (index >= itemCount) {
+        throw Exception(ErrorCode::InvalidArgument, "Invalid item index");
+    }
+
+    // 获取密码
+    std::wstring password;
+    if (impl_->passwordCallback) {
+        password = impl_->passwordCallback();
+    }
+
+    TestItemCallback* callbackImpl = new TestItemCallback(index, password);
+    CMyComPtr<IArchiveExtractCallback> extractCallback = callbackImpl;
+
+    // 执行测试（testMode = 1）：解码器校验数据和CRC，不写出任何数据
+    const UInt32 indices[] = {index};
+    HRESULT hr = impl_->archive->Extract(indices, 1, 1, extractCallback);
+
+    if (FAILED(hr)) {
+        throw Exception(sevenzip::hresult_to_error_code(hr), "Failed to test item");
+    }
+
+    // kOK = 0, kUnsupportedMethod = 1, kDataError = 2, kCRCError = 3,
+    // kUnexpectedEnd = 5, kWrongPassword = 9
+    switch (callbackImpl->operationResult()) {
+        case 0:
+            return true;
+        case 2:
+        case 3:
+        case 5:
+            return false;
+        case 1:
+            throw Exception(ErrorCode::UnsupportedMethod, "Unsupported compression method");
+        case 9:
+            throw Exception(ErrorCode::WrongPassword, "Wrong password");
+        default:
+            throw Exception(ErrorCode::CorruptedArchive, "Failed to test item");
+    }
+}
+
 void ArchiveReader::setPasswordCallback(PasswordCallback callback) {
     impl_->passwordCallback = callback;
 }
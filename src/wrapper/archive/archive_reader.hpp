@@ -112,6 +112,9 @@ class ArchiveReader {
     // 测试归档完整性
     bool testArchive();
 
+    // 以测试模式解码单个项目：数据或CRC错误返回false，其他失败抛出异常
+    bool testItem(uint32_t index);
+
     // 设置密码回调
     void setPasswordCallback(PasswordCallback callback);
 
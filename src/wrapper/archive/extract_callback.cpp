@@ -129,6 +129,7 @@ Z7_COM7F_IMF(ExtractToFileCallback::GetStream(UInt32 index, ISequentialOutStream
                                               Int32 askExtractMode)) {
     *outStream = nullptr;
     currentOutStream_ = nullptr;
+    currentFile_ = nullptr;
 
     // 如果是测试模式或跳过模式，不需要输出流
     // kExtract = 0
@@ -152,7 +153,8 @@ Z7_COM7F_IMF(ExtractToFileCallback::GetStream(UInt32 index, ISequentialOutStream
 
     // 创建文件输出流
     try {
-        currentOutStream_ = new FileOutStream(outputPath_);
+        currentFile_ = new FileOutStream(outputPath_, true, kExtractWriteBufferSize);
+        currentOutStream_ = currentFile_;
         *outStream = currentOutStream_.operator->();
         (*outStream)->AddRef();
     } catch (const std::exception& e) {
@@ -167,8 +169,18 @@ Z7_COM7F_IMF(ExtractToFileCallback::PrepareOperation(Int32 askExtractMode)) {
 }
 
 Z7_COM7F_IMF(ExtractToFileCallback::SetOperationResult(Int32 opRes)) {
+    // 显式刷新写缓冲以便报告写入错误（析构时的刷新无法返回错误）
+    HRESULT flushResult = currentFile_ ? currentFile_->flush() : S_OK;
+    currentFile_ = nullptr;
     currentOutStream_ = nullptr;
 
+    if (opRes == 0 && FAILED(flushResult)) {
+        if (std::filesystem::exists(outputPath_)) {
+            std::filesystem::remove(outputPath_);
+        }
+        return flushResult;
+    }
+
     // kOK = 0, kUnsupportedMethod = 1, kDataError = 2, kCRCError = 3
     if (opRes != 0) {  // kOK
         // 提取失败，删除可能创建的文件
@@ -234,6 +246,7 @@ Z7_COM7F_IMF(ExtractToDirectoryCallback::GetStream(UInt32 index, ISequentialOutS
                                                    Int32 askExtractMode)) {
     *outStream = nullptr;
     currentOutStream_ = nullptr;
+    currentFile_ = nullptr;
     currentIndex_ = index;
 
     // 如果是测试模式或跳过模式，不需要输出流
@@ -272,7 +285,8 @@ Z7_COM7F_IMF(ExtractToDirectoryCallback::GetStream(UInt32 index, ISequentialOutS
 
     // 创建文件输出流
     try {
-        currentOutStream_ = new FileOutStream(currentFilePath_);
+        currentFile_ = new FileOutStream(currentFilePath_, true, kExtractWriteBufferSize);
+        currentOutStream_ = currentFile_;
         *outStream = currentOutStream_.operator->();
         (*outStream)->AddRef();
     } catch (const std::exception& e) {
@@ -287,8 +301,19 @@ Z7_COM7F_IMF(ExtractToDirectoryCallback::PrepareOperation(Int32 askExtractMode))
 }
 
 Z7_COM7F_IMF(ExtractToDirectoryCallback::SetOperationResult(Int32 opRes)) {
+    // 显式刷新写缓冲以便报告写入错误（析构时的刷新无法返回错误）
+    HRESULT flushResult = currentFile_ ? currentFile_->flush() : S_OK;
+    currentFile_ = nullptr;
     currentOutStream_ = nullptr;
 
+    if (opRes == 0 && FAILED(flushResult)) {
+        if (!currentFilePath_.empty() && std::filesystem::exists(currentFilePath_)) {
+            std::filesystem::remove(currentFilePath_);
+        }
+        currentFilePath_.clear();
+        return flushResult;
+    }
+
     // kOK = 0, kUnsupportedMethod = 1, kDataError = 2, kCRCError = 3
     if (opRes != 0) {  // kOK
         // 提取失败，删除可能创建的文件
@@ -322,4 +347,48 @@ Z7_COM7F_IMF(ExtractToDirectoryCallback::CryptoGetTextPassword(BSTR* password))
     return S_OK;
 }
 
+// ============================================================================
+// TestItemCallback
+// ============================================================================
+
+TestItemCallback::TestItemCallback(uint32_t index, const std::wstring& password)
+    : targetIndex_(index), password_(password) {}
+
+// IProgress methods
+Z7_COM7F_IMF(TestItemCallback::SetTotal(UInt64 total)) {
+    return S_OK;
+}
+
+Z7_COM7F_IMF(TestItemCallback::SetCompleted(const UInt64* completeValue)) {
+    return S_OK;
+}
+
+Z7_COM7F_IMF(TestItemCallback::GetStream(UInt32 index, ISequentialOutStream** outStream,
+                                         Int32 askExtractMode)) {
+    // 测试模式下解码器自行校验数据，不需要输出流
+    *outStream = nullptr;
+    currentIndex_ = index;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(TestItemCallback::PrepareOperation(Int32 askExtractMode)) {
+    return S_OK;
+}
+
+Z7_COM7F_IMF(TestItemCallback::SetOperationResult(Int32 opRes)) {
+    // 只记录结果，不把校验失败转换为错误，由调用方区分“数据损坏”和“操作失败”
+    if (currentIndex_ == targetIndex_) {
+        operationResult_ = opRes;
+    }
+    return S_OK;
+}
+
+Z7_COM7F_IMF(TestItemCallback::CryptoGetTextPassword(BSTR* password)) {
+    if (password_.empty()) {
+        return E_ABORT;
+    }
+    *password = ::SysAllocString(password_.c_str());
+    return S_OK;
+}
+
 }  // namespace sevenzip::detail
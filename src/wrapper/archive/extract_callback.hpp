@@ -16,6 +16,9 @@
 
 namespace sevenzip::detail {
 
+// 提取到文件时每个输出流的写缓冲大小：解码器输出的小块数据先合并再写入磁盘
+inline constexpr size_t kExtractWriteBufferSize = 1 << 20;
+
 // 提取进度回调
 using ExtractProgressCallback = std::function<bool(uint64_t completed, uint64_t total)>;
 
@@ -92,6 +95,7 @@ class ExtractToFileCallback Z7_final : public IArchiveExtractCallback,
     ExtractProgressCallback progressCallback_;
 
     CMyComPtr<ISequentialOutStream> currentOutStream_;
+    FileOutStream* currentFile_ = nullptr;  // 与 currentOutStream_ 指向同一对象，用于显式刷新
     uint64_t totalSize_ = 0;
     uint64_t completedSize_ = 0;
 
@@ -134,6 +138,7 @@ class ExtractToDirectoryCallback Z7_final : public IArchiveExtractCallback,
     ExtractProgressCallback progressCallback_;
 
     CMyComPtr<ISequentialOutStream> currentOutStream_;
+    FileOutStream* currentFile_ = nullptr;  // 与 currentOutStream_ 指向同一对象，用于显式刷新
     std::filesystem::path currentFilePath_;
     uint64_t totalSize_ = 0;
     uint64_t completedSize_ = 0;
@@ -147,4 +152,43 @@ class ExtractToDirectoryCallback Z7_final : public IArchiveExtractCallback,
     virtual ~ExtractToDirectoryCallback() = default;
 };
 
+// 测试单个项目的回调（testMode=1，不创建输出流），记录目标项目的操作结果
+class TestItemCallback Z7_final : public IArchiveExtractCallback,
+                                  public ICryptoGetTextPassword,
+                                  public CMyUnknownImp {
+   public:
+    // IUnknown methods
+    Z7_COM_UNKNOWN_IMP_SPEC(Z7_COM_QI_ENTRY_UNKNOWN(IArchiveExtractCallback)
+                                Z7_COM_QI_ENTRY(IArchiveExtractCallback)
+                                    Z7_COM_QI_ENTRY(ICryptoGetTextPassword))
+
+    // IProgress methods (inherited via IArchiveExtractCallback)
+    __declspec(nothrow) STDMETHODIMP SetTotal(UInt64 total) throw() override final;
+    __declspec(nothrow) STDMETHODIMP
+    SetCompleted(const UInt64* completeValue) throw() override final;
+
+    // IArchiveExtractCallback methods
+    __declspec(nothrow) STDMETHODIMP GetStream(UInt32 index, ISequentialOutStream** outStream,
+                                               Int32 askExtractMode) throw() override final;
+    __declspec(nothrow) STDMETHODIMP PrepareOperation(Int32 askExtractMode) throw() override final;
+    __declspec(nothrow) STDMETHODIMP SetOperationResult(Int32 opRes) throw() override final;
+
+    // ICryptoGetTextPassword method
+    __declspec(nothrow) STDMETHODIMP CryptoGetTextPassword(BSTR* password) throw() override final;
+
+   private:
+    uint32_t targetIndex_;
+    uint32_t currentIndex_ = 0;
+    std::wstring password_;
+    Int32 operationResult_ = -1;
+
+   public:
+    explicit TestItemCallback(uint32_t index, const std::wstring& password = L"");
+
+    virtual ~TestItemCallback() = default;
+
+    // 目标项目的操作结果（NArchive::NExtract::NOperationResult），-1 表示未收到
+    Int32 operationResult() const { return operationResult_; }
+};
+
 }  // namespace sevenzip::detail
@@ -1,6 +1,9 @@
 // File stream implementation using native C interface to avoid Windows SDK conflicts
 #include "stream_file.hpp"
 
+#include <cstdint>
+#include <vector>
+
 #include "../common/wrapper_string.hpp"
 #include "stream_file_native.h"
 
@@ -145,34 +148,97 @@ HRESULT FileInStream::DoGetProps(UInt64* size, FILETIME* cTime, FILETIME* aTime,
 // FileOutStream
 //=============================================================================
 
+namespace {
+
+// 每个线程缓存一块写缓冲：顺序提取多个文件时复用同一块堆内存，而不是每个文件各分配一次
+thread_local std::vector<uint8_t> tlsSpareWriteBuffer;
+
+std::vector<uint8_t> acquireWriteBuffer(size_t size) {
+    std::vector<uint8_t> buffer;
+    if (tlsSpareWriteBuffer.capacity() >= size) {
+        buffer.swap(tlsSpareWriteBuffer);
+    }
+    buffer.clear();
+    buffer.reserve(size);
+    return buffer;
+}
+
+void releaseWriteBuffer(std::vector<uint8_t>& buffer) {
+    if (buffer.capacity() > tlsSpareWriteBuffer.capacity()) {
+        buffer.clear();
+        tlsSpareWriteBuffer.swap(buffer);
+    }
+}
+
+}  // namespace
+
 class FileOutStream::Impl {
    public:
     NativeFileHandle handle = nullptr;
+    std::vector<uint8_t> buffer;  // 待写入的数据，容量固定为 bufferSize
+    size_t bufferSize = 0;        // 0 表示不缓冲
+
+    // 循环写入直到数据全部落盘
+    HRESULT writeAll(const uint8_t* data, size_t size) {
+        while (size > 0) {
+            UInt32 written = 0;
+            if (!NativeFile_Write(handle, data, static_cast<uint32_t>(size), &written)) {
+                return HRESULT_FROM_WIN32(NativeFile_GetLastError());
+            }
+            if (written == 0) {
+                return E_FAIL;
+            }
+            data += written;
+            size -= written;
+        }
+        return S_OK;
+    }
+
+    HRESULT flush() {
+        HRESULT hr = writeAll(buffer.data(), buffer.size());
+        buffer.clear();
+        return hr;
+    }
 };
 
-FileOutStream::FileOutStream(const std::wstring& path, bool createAlways)
+FileOutStream::FileOutStream(const std::wstring& path, bool createAlways, size_t bufferSize)
     : impl_(std::make_unique<Impl>()), path_(path) {
     impl_->handle = NativeFile_OpenWrite(path.c_str(), createAlways);
     if (!impl_->handle) {
         throw Exception(ErrorCode::AccessDenied,
                         "Cannot open file for writing: " + wstring_to_utf8(path));
     }
+    if (bufferSize > 0) {
+        impl_->buffer = acquireWriteBuffer(bufferSize);
+        impl_->bufferSize = bufferSize;
+    }
 }
 
-FileOutStream::FileOutStream(const std::string& path, bool createAlways)
-    : FileOutStream(utf8_to_wstring(path), createAlways) {}
+FileOutStream::FileOutStream(const std::string& path, bool createAlways, size_t bufferSize)
+    : FileOutStream(utf8_to_wstring(path), createAlways, bufferSize) {}
 
 FileOutStream::~FileOutStream() {
     if (impl_ && impl_->handle) {
+        impl_->flush();
         NativeFile_Close(impl_->handle);
         impl_->handle = nullptr;
     }
+    if (impl_) {
+        releaseWriteBuffer(impl_->buffer);
+    }
 }
 
 bool FileOutStream::isOpen() const {
     return impl_ && impl_->handle != nullptr;
 }
 
+HRESULT FileOutStream::flush() {
+    if (!isOpen()) {
+        return E_HANDLE;
+    }
+    return impl_->flush();
+}
+
 HRESULT FileOutStream::DoWrite(const void* data, UInt32 size, UInt32* processedSize) {
     if (!data && size > 0) {
         return E_POINTER;
@@ -182,13 +248,40 @@ HRESULT FileOutStream::DoWrite(const void* data, UInt32 size, UInt32* processedS
         return E_HANDLE;
     }
 
-    UInt32 realProcessed = 0;
-    if (!NativeFile_Write(impl_->handle, data, size, &realProcessed)) {
-        return HRESULT_FROM_WIN32(NativeFile_GetLastError());
+    if (impl_->bufferSize == 0) {
+        UInt32 realProcessed = 0;
+        if (!NativeFile_Write(impl_->handle, data, size, &realProcessed)) {
+            return HRESULT_FROM_WIN32(NativeFile_GetLastError());
+        }
+
+        if (processedSize) {
+            *processedSize = realProcessed;
+        }
+
+        return S_OK;
+    }
+
+    // 缓冲模式：小块数据先合并到缓冲区，放不下时先刷新；大块数据直接写入
+    auto& buffer = impl_->buffer;
+    if (buffer.size() + size > impl_->bufferSize) {
+        HRESULT hr = impl_->flush();
+        if (FAILED(hr)) {
+            return hr;
+        }
+    }
+
+    const auto* bytes = static_cast<const uint8_t*>(data);
+    if (size >= impl_->bufferSize) {
+        HRESULT hr = impl_->writeAll(bytes, size);
+        if (FAILED(hr)) {
+            return hr;
+        }
+    } else {
+        buffer.insert(buffer.end(), bytes, bytes + size);
     }
 
     if (processedSize) {
-        *processedSize = realProcessed;
+        *processedSize = size;
     }
 
     return S_OK;
@@ -199,6 +292,11 @@ HRESULT FileOutStream::DoSeek(Int64 offset, UInt32 seekOrigin, UInt64* newPositi
         return E_HANDLE;
     }
 
+    HRESULT hr = impl_->flush();
+    if (FAILED(hr)) {
+        return hr;
+    }
+
     UInt64 newPos = 0;
     if (!NativeFile_Seek(impl_->handle, offset, seekOrigin, &newPos)) {
         return HRESULT_FROM_WIN32(NativeFile_GetLastError());
@@ -216,6 +314,11 @@ HRESULT FileOutStream::DoSetSize(UInt64 newSize) {
         return E_HANDLE;
     }
 
+    HRESULT hr = impl_->flush();
+    if (FAILED(hr)) {
+        return hr;
+    }
+
     if (!NativeFile_SetSize(impl_->handle, newSize)) {
         return HRESULT_FROM_WIN32(NativeFile_GetLastError());
     }
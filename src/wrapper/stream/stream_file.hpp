@@ -1,5 +1,6 @@
 #pragma once
 
+#include <cstddef>
 #include <memory>
 #include <string>
 
@@ -64,17 +65,21 @@ class FileOutStream : public COMOutStreamImpl {
      * @brief 创建/打开文件用于写入
      * @param path 文件路径（宽字符）
      * @param createAlways true=总是创建新文件，false=如果存在则打开
+     * @param bufferSize 写缓冲大小（字节），0=不缓冲，每次 Write 直接写入文件
      * @throws Exception 如果文件打开失败
      */
-    explicit FileOutStream(const std::wstring& path, bool createAlways = true);
+    explicit FileOutStream(const std::wstring& path, bool createAlways = true,
+                           size_t bufferSize = 0);
 
     /**
      * @brief 创建/打开文件用于写入
      * @param path 文件路径（UTF-8）
      * @param createAlways true=总是创建新文件，false=如果存在则打开
+     * @param bufferSize 写缓冲大小（字节），0=不缓冲，每次 Write 直接写入文件
      * @throws Exception 如果文件打开失败
      */
-    explicit FileOutStream(const std::string& path, bool createAlways = true);
+    explicit FileOutStream(const std::string& path, bool createAlways = true,
+                           size_t bufferSize = 0);
 
     ~FileOutStream() override;
 
@@ -83,6 +88,13 @@ class FileOutStream : public COMOutStreamImpl {
      */
     bool isOpen() const;
 
+    /**
+     * @brief 将写缓冲中的数据写入文件
+     *
+     * 析构时也会刷新，但无法报告错误；需要确认写入成功时应显式调用。
+     */
+    HRESULT flush();
+
     /**
      * @brief 获取文件路径
      */
@@ -1,6 +1,7 @@
 // test_archive_advanced.c - Advanced tests for archive reader functionality
 // Tests edge cases, item properties, timestamps, and various archive formats
 
+#include <stdint.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -326,6 +327,146 @@ void test_large_item_count(void) {
     remove("test_many_items.7z");
 }
 
+void test_item_info_range(void) {
+    printf("\n=== Testing Batched Item Info ===\n");
+
+    create_test_archive_with_items("test_item_range.7z", 4);
+
+    sz_archive_handle archive;
+    sz_result result = sz_archive_open("test_item_range.7z", &archive);
+
+    if (result != SZ_OK) {
+        printf("Skipping test (archive not available)\n");
+        return;
+    }
+
+    size_t count = 0;
+    sz_archive_get_item_count(archive, &count);
+
+    sz_item_info* infos = (sz_item_info*)calloc(count, sizeof(sz_item_info));
+    result = sz_archive_get_item_info_range(archive, 0, count, infos);
+    TEST_ASSERT(result == SZ_OK, "Range of item info retrieved in one call");
+
+    if (result == SZ_OK) {
+        for (size_t i = 0; i < count; i++) {
+            sz_item_info single = {0};
+            sz_archive_get_item_info(archive, i, &single);
+            TEST_ASSERT(infos[i].index == single.index, "Batched index matches single lookup");
+            TEST_ASSERT(infos[i].path && single.path && strcmp(infos[i].path, single.path) == 0,
+                        "Batched path matches single lookup");
+            TEST_ASSERT(infos[i].size == single.size, "Batched size matches single lookup");
+            sz_item_info_free(&single);
+        }
+        sz_item_info_free_range(infos, count);
+        TEST_ASSERT(count == 0 || infos[0].path == NULL, "Range of item info properly freed");
+    }
+
+    // Range extending past the end must fail without allocating anything
+    result = sz_archive_get_item_info_range(archive, 1, count, infos);
+    TEST_ASSERT(result == SZ_E_INDEX_OUT_OF_RANGE, "Out of range batch fails");
+
+    free(infos);
+    sz_archive_close(archive);
+    remove("test_item_range.7z");
+}
+
+void test_verify_crc(void) {
+    printf("\n=== Testing CRC Verification ===\n");
+
+    create_test_archive_with_items("test_verify_crc.7z", 2);
+
+    sz_archive_handle archive;
+    sz_result result = sz_archive_open("test_verify_crc.7z", &archive);
+
+    if (result != SZ_OK) {
+        printf("Skipping test (archive not available)\n");
+        return;
+    }
+
+    size_t count = 0;
+    sz_archive_get_item_count(archive, &count);
+
+    for (size_t i = 0; i < count; i++) {
+        int valid = -1;
+        result = sz_archive_verify_crc(archive, i, &valid);
+        TEST_ASSERT(result == SZ_OK, "CRC verification runs");
+        TEST_ASSERT(valid == 1, "Stored CRC matches item data");
+    }
+
+    result = sz_archive_verify_crc(archive, 0, NULL);
+    TEST_ASSERT(result == SZ_E_INVALID_ARGUMENT, "NULL output rejected");
+
+    sz_archive_close(archive);
+    remove("test_verify_crc.7z");
+}
+
+void test_verify_crc_corrupted(void) {
+    printf("\n=== Testing CRC Verification (Corrupted Data) ===\n");
+
+    static const char pattern[] = "libsevenzip-crc-pattern-libsevenzip-crc-pattern";
+    const size_t pattern_len = sizeof(pattern) - 1;
+
+    sz_writer_handle writer;
+    sz_result result = sz_writer_create("test_verify_crc_bad.7z", SZ_FORMAT_7Z, &writer);
+    if (result != SZ_OK) {
+        printf("Skipping test (writer not available)\n");
+        return;
+    }
+    // Stored, so the pattern appears verbatim in the packed stream
+    sz_writer_set_compression_level(writer, SZ_LEVEL_NONE);
+    sz_writer_add_memory(writer, pattern, pattern_len, "pattern.txt");
+    result = sz_writer_finalize(writer);
+    sz_writer_cancel(writer);
+    TEST_ASSERT(result == SZ_OK, "Test archive created");
+
+    FILE* f = fopen("test_verify_crc_bad.7z", "rb");
+    TEST_ASSERT(f != NULL, "Archive file readable");
+    if (f == NULL) {
+        return;
+    }
+    fseek(f, 0, SEEK_END);
+    long file_size = ftell(f);
+    fseek(f, 0, SEEK_SET);
+    unsigned char* bytes = (unsigned char*)malloc((size_t)file_size);
+    size_t read = fread(bytes, 1, (size_t)file_size, f);
+    fclose(f);
+
+    // Flip one byte inside the stored payload
+    long offset = -1;
+    for (long i = 0; read == (size_t)file_size && i + (long)pattern_len <= file_size; i++) {
+        if (memcmp(bytes + i, pattern, pattern_len) == 0) {
+            offset = i;
+            break;
+        }
+    }
+    TEST_ASSERT(offset >= 0, "Stored payload located");
+    if (offset < 0) {
+        free(bytes);
+        remove("test_verify_crc_bad.7z");
+        return;
+    }
+    bytes[offset + pattern_len / 2] ^= 0xFF;
+
+    f = fopen("test_verify_crc_bad.7z", "wb");
+    fwrite(bytes, 1, (size_t)file_size, f);
+    fclose(f);
+    free(bytes);
+
+    sz_archive_handle archive;
+    result = sz_archive_open("test_verify_crc_bad.7z", &archive);
+    TEST_ASSERT(result == SZ_OK, "Corrupted archive still opens");
+
+    if (result == SZ_OK) {
+        int valid = -1;
+        result = sz_archive_verify_crc(archive, 0, &valid);
+        TEST_ASSERT(result == SZ_OK, "CRC verification runs on corrupted data");
+        TEST_ASSERT(valid == 0, "CRC mismatch reported");
+        sz_archive_close(archive);
+    }
+
+    remove("test_verify_crc_bad.7z");
+}
+
 // Global variables for progress callback test
 static int g_callback_count = 0;
 
@@ -376,6 +517,90 @@ void test_progress_callback(void) {
 #endif
 }
 
+typedef struct {
+    int calls;
+    uint64_t last_completed;
+    uint64_t last_total;
+    int cancel;
+} progress_record;
+
+static int progress_record_callback(uint64_t completed, uint64_t total, void* user_data) {
+    progress_record* record = (progress_record*)user_data;
+    record->calls++;
+    record->last_completed = completed;
+    record->last_total = total;
+    return record->cancel ? 0 : 1;
+}
+
+static sz_result extract_with_interval(const char* archive_path, uint64_t interval,
+                                       progress_record* record) {
+    sz_archive_handle archive;
+    sz_result result = sz_archive_open(archive_path, &archive);
+    if (result != SZ_OK) {
+        return result;
+    }
+
+    sz_archive_set_progress_interval(archive, interval);
+    result = sz_archive_extract_all(archive, "temp_interval_dir", progress_record_callback, record);
+    sz_archive_close(archive);
+    return result;
+}
+
+void test_progress_interval(void) {
+    printf("\n=== Testing Progress Interval ===\n");
+
+    // A large stored item produces many progress ticks during extraction
+    const size_t payload_size = 16 * 1024 * 1024;
+    unsigned char* payload = (unsigned char*)malloc(payload_size);
+    for (size_t i = 0; i < payload_size; i++) {
+        payload[i] = (unsigned char)(i * 2654435761u >> 24);
+    }
+
+    sz_writer_handle writer;
+    sz_result result = sz_writer_create("test_progress_interval.7z", SZ_FORMAT_7Z, &writer);
+    if (result != SZ_OK) {
+        printf("Skipping test (writer not available)\n");
+        free(payload);
+        return;
+    }
+    sz_writer_set_compression_level(writer, SZ_LEVEL_NONE);
+    sz_writer_add_memory(writer, payload, payload_size, "payload.bin");
+    result = sz_writer_finalize(writer);
+    sz_writer_cancel(writer);
+    free(payload);
+    TEST_ASSERT(result == SZ_OK, "Large test archive created");
+
+    progress_record every_tick = {0};
+    result = extract_with_interval("test_progress_interval.7z", 0, &every_tick);
+    TEST_ASSERT(result == SZ_OK, "Extraction with interval 0 succeeds");
+    TEST_ASSERT(every_tick.calls > 1, "Interval 0 reports several progress ticks");
+    TEST_ASSERT(every_tick.last_completed == every_tick.last_total,
+                "Interval 0 reports completion");
+
+    progress_record throttled = {0};
+    result = extract_with_interval("test_progress_interval.7z", UINT64_MAX, &throttled);
+    TEST_ASSERT(result == SZ_OK, "Extraction with a large interval succeeds");
+    TEST_ASSERT(throttled.calls >= 1 && throttled.calls < every_tick.calls,
+                "Large interval reduces the number of callbacks");
+    TEST_ASSERT(throttled.last_completed == throttled.last_total,
+                "Large interval still reports completion");
+    printf("  Callbacks: %d unthrottled, %d throttled\n", every_tick.calls, throttled.calls);
+
+    progress_record cancelling = {0};
+    cancelling.cancel = 1;
+    result = extract_with_interval("test_progress_interval.7z", 0, &cancelling);
+    TEST_ASSERT(result == SZ_E_CANCELLED, "Returning zero from the callback cancels extraction");
+
+    remove("test_progress_interval.7z");
+
+// Clean up extracted files
+#ifdef _WIN32
+    system("rmdir /s /q temp_interval_dir 2>nul");
+#else
+    system("rm -rf temp_interval_dir");
+#endif
+}
+
 void test_multiple_formats(void) {
     printf("\n=== Testing Multiple Archive Formats ===\n");
 
@@ -434,7 +659,11 @@ int main(void) {
     test_archive_test_integrity();
     test_empty_archive();
     test_large_item_count();
+    test_item_info_range();
+    test_verify_crc();
+    test_verify_crc_corrupted();
     test_progress_callback();
+    test_progress_interval();
     test_multiple_formats();
 
     // Print summary
@@ -443,6 +443,49 @@ void test_pending_count_tracking(void) {
     }
 }
 
+void test_add_files_batch(void) {
+    printf("\n=== Testing Batched File Addition ===\n");
+
+    create_test_file("batch_a.txt", "File A");
+    create_test_file("batch_b.txt", "File B");
+    create_test_file("batch_c.txt", "File C");
+
+    sz_writer_handle writer;
+    sz_result result = sz_writer_create("test_batch.7z", SZ_FORMAT_7Z, &writer);
+    TEST_ASSERT(result == SZ_OK, "Writer created");
+
+    if (result == SZ_OK) {
+        const char* files[] = {"batch_a.txt", "batch_b.txt", "batch_c.txt"};
+        const char* names[] = {"dir/a.txt", NULL, "c.txt"};
+
+        result = sz_writer_add_files(writer, files, names, 3);
+        TEST_ASSERT(result == SZ_OK, "Files added in one call");
+
+        size_t count = 0;
+        sz_writer_get_pending_count(writer, &count);
+        TEST_ASSERT(count == 3, "Pending count reflects batched files");
+
+        result = sz_writer_add_files(writer, NULL, NULL, 1);
+        TEST_ASSERT(result == SZ_E_INVALID_ARGUMENT, "NULL file list rejected");
+
+        result = sz_writer_finalize(writer);
+        TEST_ASSERT(result == SZ_OK, "Archive finalized");
+        sz_writer_cancel(writer);
+
+        sz_archive_handle archive;
+        if (sz_archive_open("test_batch.7z", &archive) == SZ_OK) {
+            sz_archive_get_item_count(archive, &count);
+            TEST_ASSERT(count == 3, "Archive contains all batched files");
+            sz_archive_close(archive);
+        }
+        remove("test_batch.7z");
+    }
+
+    remove("batch_a.txt");
+    remove("batch_b.txt");
+    remove("batch_c.txt");
+}
+
 int main(void) {
     printf("==============================================\n");
     printf(" Advanced Archive Writer Tests\n");
@@ -459,6 +502,7 @@ int main(void) {
     test_writer_error_handling();
     test_memory_archive_variations();
     test_pending_count_tracking();
+    test_add_files_batch();
 
     // Print summary
     printf("\n==============================================\n");
@@ -3,16 +3,19 @@ pytest测试 - Archive读取功能
 """
 import pytest
 from pathlib import Path
-from sevenzip import Archive, SevenZipError
+from sevenzip import Archive, Writer, SevenZipError, SzResult
+
+# 测试归档所在目录，导入时计算一次
+_DATA_DIR = Path(__file__).resolve().parents[2] / "tests" / "data" / "archives"
 
 
 class TestArchive:
     """Archive类测试"""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def test_archive_path(self):
         """测试归档路径"""
-        return Path(__file__).parent.parent.parent / "tests" / "data" / "archives" / "test.7z"
+        return _DATA_DIR / "test.7z"
     
     def test_open_archive(self, test_archive_path):
         """测试打开归档"""
@@ -43,6 +46,41 @@ class TestArchive:
             assert item.size == 64
             assert not item.is_directory
     
+    def test_list_items_array(self, test_archive_path):
+        """测试NumPy结构化数组列表"""
+        pytest.importorskip("numpy")
+        with Archive.open(str(test_archive_path)) as archive:
+            items = archive.list_items_array()
+            assert len(items) == 3
+            assert items[0]['path'] == b"test1.txt"
+            assert items[0]['size'] == 64
+            assert not items[0]['is_directory']
+    
+    def test_filter_and_total_packed_size(self, test_archive_path):
+        """测试向量化筛选与压缩大小汇总"""
+        pytest.importorskip("numpy")
+        with Archive.open(str(test_archive_path)) as archive:
+            items = list(archive)
+            expected = sum(item.packed_size for item in items if not item.is_directory)
+            assert archive.total_packed_size() == expected
+            
+            matched = archive.filter(lambda a: a['size'] == 64)
+            assert [item.path for item in matched] == [
+                item.path for item in items if item.size == 64
+            ]
+    
+    def test_find(self, test_archive_path):
+        """测试按后缀和大小查找项目"""
+        pytest.importorskip("numpy")
+        with Archive.open(str(test_archive_path)) as archive:
+            items = list(archive)
+            found = archive.find(suffix=".txt", min_size=64, max_size=64)
+            assert [item.path for item in found] == [
+                item.path for item in items
+                if item.path.endswith(".txt") and item.size == 64 and not item.is_directory
+            ]
+            assert archive.find(suffix=".nonexistent") == []
+    
     def test_get_item_info(self, test_archive_path):
         """测试获取项目信息"""
         with Archive.open(str(test_archive_path)) as archive:
@@ -51,6 +89,23 @@ class TestArchive:
             assert item.path == "test1.txt"
             assert item.size > 0
     
+    def test_item_info_cached(self, test_archive_path):
+        """测试项目数量与Item对象被缓存，close()后清空"""
+        archive = Archive.open(str(test_archive_path))
+        try:
+            assert archive.item_count == archive.item_count == 3
+            item = archive.get_item_info(0)
+            assert archive.get_item_info(0) is item
+            # 遍历复用已缓存的Item
+            assert list(archive)[0] is item
+        finally:
+            archive.close()
+        
+        assert archive._item_count is None
+        assert not archive._item_cache
+        with pytest.raises(SevenZipError):
+            archive.get_item_info(0)
+    
     def test_extract_to_memory(self, test_archive_path):
         """测试提取到内存"""
         with Archive.open(str(test_archive_path)) as archive:
@@ -59,6 +114,97 @@ class TestArchive:
             assert len(data) > 0
             assert isinstance(data, bytes)
     
+    def test_extract_to_memoryview(self, test_archive_path):
+        """测试零拷贝提取到memoryview"""
+        with Archive.open(str(test_archive_path)) as archive:
+            view = archive.extract_to_memoryview(0)
+            assert isinstance(view, memoryview)
+            assert view.readonly
+            assert bytes(view) == archive.extract_to_memory(0)
+    
+    def test_extract_with_progress(self, test_archive_path, tmp_path):
+        """测试提取全部项目（带进度回调）"""
+        calls = []
+        
+        def progress(completed, total):
+            calls.append((completed, total))
+            return True
+        
+        with Archive.open(str(test_archive_path)) as archive:
+            archive.extract(tmp_path, progress_callback=progress)
+        
+        assert (tmp_path / "test1.txt").exists()
+        assert calls
+        # 完成时总会回调一次
+        completed, total = calls[-1]
+        assert completed == total
+    
+    def test_extract_cancelled(self, tmp_path):
+        """测试进度回调取消提取时报告CANCELLED"""
+        archive_path = tmp_path / "cancel.7z"
+        with Writer.create(str(archive_path), format='7z') as writer:
+            writer.set_compression_level('none')
+            for i in range(3):
+                writer.add_memory(bytes([i]) * (1 << 20), f"file{i}.bin")
+        
+        calls = []
+        
+        def cancel(completed, total):
+            calls.append((completed, total))
+            return False
+        
+        with Archive.open(str(archive_path)) as archive:
+            with pytest.raises(SevenZipError) as exc_info:
+                archive.extract(tmp_path / "out", progress_callback=cancel, progress_interval=0)
+        
+        assert calls
+        assert exc_info.value.code == SzResult.CANCELLED
+    
+    def test_verify_crc(self, test_archive_path):
+        """测试CRC校验"""
+        with Archive.open(str(test_archive_path)) as archive:
+            item = archive.get_item_info(0)
+            assert item.has_crc
+            assert item.verify()
+            assert archive.verify_crc(0)
+    
+    def test_item_does_not_keep_archive_alive(self, test_archive_path):
+        """测试Item不持有归档的强引用"""
+        import gc
+        import weakref
+        
+        archive = Archive.open(str(test_archive_path))
+        item = archive.get_item_info(0)
+        archive_ref = weakref.ref(archive)
+        archive.close()
+        del archive
+        gc.collect()
+        
+        assert archive_ref() is None
+        with pytest.raises(SevenZipError):
+            item.verify()
+    
+    def test_verify_crc_corrupted(self, tmp_path):
+        """测试损坏数据的CRC校验"""
+        pattern = b"libsevenzip-crc-pattern-" * 4
+        source = tmp_path / "pattern.txt"
+        source.write_bytes(pattern)
+        
+        output = tmp_path / "corrupted.7z"
+        with Writer.create(str(output), format='7z') as writer:
+            # 不压缩，使数据原样存储在归档中
+            writer.set_compression_level('none')
+            writer.add_file(str(source), "pattern.txt")
+        
+        data = bytearray(output.read_bytes())
+        offset = data.find(pattern)
+        assert offset >= 0
+        data[offset + len(pattern) // 2] ^= 0xFF
+        output.write_bytes(bytes(data))
+        
+        with Archive.open(str(output)) as archive:
+            assert archive.verify_crc(0) is False
+    
     def test_open_nonexistent_file(self):
         """测试打开不存在的文件"""
         with pytest.raises(SevenZipError):
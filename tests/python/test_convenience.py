@@ -6,6 +6,9 @@ from pathlib import Path
 import shutil
 from sevenzip import create_archive, extract_archive, Archive
 
+# 测试归档所在目录，导入时计算一次
+_DATA_DIR = Path(__file__).resolve().parents[2] / "tests" / "data" / "archives"
+
 
 class TestConvenienceFunctions:
     """便利函数测试"""
@@ -52,7 +55,7 @@ class TestConvenienceFunctions:
     def test_extract_archive(self, tmp_path):
         """测试extract_archive"""
         # 使用项目中的测试归档
-        test_archive = Path(__file__).parent.parent.parent / "tests" / "data" / "archives" / "test.7z"
+        test_archive = _DATA_DIR / "test.7z"
         output_dir = tmp_path / "extracted"
         
         extract_archive(
@@ -66,6 +69,56 @@ class TestConvenienceFunctions:
         extracted_files = list(output_dir.rglob("*.txt"))
         assert len(extracted_files) >= 3
     
+    def test_extract_archive_parallel(self, tmp_path, temp_files, monkeypatch):
+        """测试extract_archive多线程提取"""
+        archive_path = tmp_path / "parallel.zip"
+        create_archive(
+            output_path=str(archive_path),
+            files=temp_files,
+            format='zip'
+        )
+        with Archive.open(str(archive_path)) as archive:
+            assert not archive.is_solid
+        
+        # 确认走的是逐项并行提取，而不是整体提取
+        extracted_indices = []
+        extract_item = Archive.extract_item
+        
+        def spy_extract_item(self, index, output_dir):
+            extracted_indices.append(index)
+            extract_item(self, index, output_dir)
+        
+        def fail_extract(self, output_dir, *args, **kwargs):
+            raise AssertionError("并行提取不应调用Archive.extract")
+        
+        monkeypatch.setattr(Archive, "extract_item", spy_extract_item)
+        monkeypatch.setattr(Archive, "extract", fail_extract)
+        
+        extract_dir = tmp_path / "extracted"
+        extract_archive(str(archive_path), str(extract_dir), max_workers=3)
+        
+        assert sorted(extracted_indices) == [0, 1, 2]
+        for source in temp_files:
+            extracted = extract_dir / Path(source).name
+            assert extracted.read_bytes() == Path(source).read_bytes()
+    
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_extract_archive_keeps_empty_directory(self, tmp_path, max_workers):
+        """测试串行与并行提取都会还原空目录"""
+        source_dir = tmp_path / "tree"
+        (source_dir / "empty").mkdir(parents=True)
+        for i in range(3):
+            (source_dir / f"file{i}.txt").write_text(f"Content {i}\n", encoding='utf-8')
+        
+        archive_path = tmp_path / "tree.zip"
+        create_archive(output_path=str(archive_path), files=[str(source_dir)], format='zip')
+        
+        extract_dir = tmp_path / "extracted"
+        extract_archive(str(archive_path), str(extract_dir), max_workers=max_workers)
+        
+        assert (extract_dir / "tree" / "empty").is_dir()
+        assert (extract_dir / "tree" / "file0.txt").read_text(encoding='utf-8') == "Content 0\n"
+    
     def test_round_trip(self, tmp_path):
         """测试完整循环：创建->提取->验证"""
         # 创建源文件
@@ -0,0 +1,374 @@
+"""
+pytest测试 - sevenzip_ffi绑定
+"""
+import ctypes
+import pickle
+import threading
+
+import pytest
+import sevenzip_ffi
+from sevenzip_ffi import (SevenZip, SevenZipError, SzFormat, SzResult, _FORMAT_MAP,
+                          _ProgressPump, _WriterHandle, _check_result, _lib, _lookup_enum)
+
+
+class TestProgressPump:
+    """_ProgressPump测试"""
+    
+    def test_ticks_delivered_in_order(self):
+        """测试进度按投递顺序送达，close()返回时已全部处理"""
+        calls = []
+        
+        def callback(completed, total):
+            calls.append((completed, total))
+            return True
+        
+        pump = _ProgressPump(callback)
+        for i in range(100):
+            assert pump.post(i, 99) == 1
+        pump.close()
+        
+        assert calls == [(i, 99) for i in range(100)]
+        assert not pump.cancelled
+    
+    def test_callback_runs_on_separate_thread(self):
+        """测试回调在独立线程上运行"""
+        threads = []
+        
+        def callback(completed, total):
+            threads.append(threading.current_thread())
+            return True
+        
+        pump = _ProgressPump(callback)
+        pump.post(1, 1)
+        pump.close()
+        
+        assert threads and threads[0] is not threading.current_thread()
+    
+    def test_callback_exception_reraised(self):
+        """测试回调中的异常在close()时重新抛出"""
+        def callback(completed, total):
+            raise ValueError("boom")
+        
+        pump = _ProgressPump(callback)
+        pump.post(1, 2)
+        with pytest.raises(ValueError, match="boom"):
+            pump.close()
+        assert pump.cancelled
+    
+    def test_cancel_stops_delivery(self):
+        """测试回调返回False后取消：后续进度不再送达，post()返回0"""
+        calls = []
+        
+        def callback(completed, total):
+            calls.append(completed)
+            return False
+        
+        pump = _ProgressPump(callback)
+        for i in range(10):
+            pump.post(i, 9)
+        pump.close()
+        
+        assert pump.cancelled
+        assert calls == [0]
+        assert pump.post(10, 9) == 0
+    
+    def test_only_false_cancels(self):
+        """测试只有显式返回False才取消，返回None继续"""
+        calls = []
+        
+        def callback(completed, total):
+            calls.append(completed)
+        
+        pump = _ProgressPump(callback)
+        for i in range(5):
+            pump.post(i, 4)
+        pump.close()
+        
+        assert not pump.cancelled
+        assert calls == [0, 1, 2, 3, 4]
+    
+    def test_false_on_final_tick_ignored(self):
+        """测试完成时（completed == total）返回False不视为取消"""
+        def callback(completed, total):
+            return completed < total
+        
+        pump = _ProgressPump(callback)
+        pump.post(5, 10)
+        pump.post(10, 10)
+        pump.close()
+        
+        assert not pump.cancelled
+    
+    def test_pumps_share_one_thread(self):
+        """测试多次提取复用同一个进度线程"""
+        threads = []
+        
+        def callback(completed, total):
+            threads.append(threading.current_thread())
+            return True
+        
+        for _ in range(3):
+            pump = _ProgressPump(callback)
+            pump.post(1, 2)
+            pump.close()
+        
+        assert len(threads) == 3
+        assert threads[0] is threads[1] is threads[2]
+    
+    def test_nested_pump_runs_inline(self):
+        """测试在回调中再次使用进度泵时同步执行，不会死锁"""
+        inner_calls = []
+        
+        def inner(completed, total):
+            inner_calls.append((completed, threading.current_thread()))
+            return True
+        
+        def outer(completed, total):
+            nested = _ProgressPump(inner)
+            nested.post(completed, total)
+            nested.close()
+            return True
+        
+        pump = _ProgressPump(outer)
+        pump.post(1, 2)
+        pump.close()
+        
+        assert len(inner_calls) == 1
+        assert inner_calls[0][1] is not threading.current_thread()
+
+
+@pytest.fixture
+def sample_archive(tmp_path):
+    """包含两个文件的测试归档"""
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "a.txt").write_bytes(b"alpha" * 10)
+    (source / "b.txt").write_bytes(b"bravo" * 20)
+    
+    archive_path = tmp_path / "sample.7z"
+    SevenZip().compress(str(source), str(archive_path))
+    return archive_path
+
+
+@pytest.fixture
+def empty_archive(tmp_path):
+    """不含任何项目的测试归档"""
+    archive_path = tmp_path / "empty.7z"
+    handle = _WriterHandle()
+    _check_result(_lib.sz_writer_create(str(archive_path).encode(), SzFormat.SEVENZIP,
+                                        ctypes.byref(handle)))
+    try:
+        _check_result(_lib.sz_writer_finalize(handle))
+    finally:
+        _lib.sz_writer_cancel(handle)
+    return archive_path
+
+
+class TestListItems:
+    """SevenZip.list_items测试"""
+    
+    def test_paths_decoded(self, tmp_path):
+        """测试路径（含非ASCII字符）逐项正确解码"""
+        source = tmp_path / "source"
+        source.mkdir()
+        names = ["a.txt", "数据.txt", "b.txt"]
+        for name in names:
+            (source / name).write_text(name, encoding='utf-8')
+        archive_path = tmp_path / "names.7z"
+        SevenZip().compress(str(source), str(archive_path))
+        
+        items = SevenZip().list_items(str(archive_path))
+        
+        assert [item['index'] for item in items] == list(range(len(items)))
+        paths = [item['path'] for item in items]
+        assert all(isinstance(path, str) for path in paths)
+        for name in names:
+            assert sum(path.endswith(name) for path in paths) == 1
+    
+    def test_empty_archive(self, empty_archive):
+        """测试空归档返回空列表"""
+        assert SevenZip().list_items(str(empty_archive)) == []
+
+
+class TestListItemsArray:
+    """SevenZip.list_items_array测试"""
+    
+    def test_columns_match_list_items(self, sample_archive):
+        """测试各列与list_items一致"""
+        pytest.importorskip("numpy")
+        sz = SevenZip()
+        expected = sz.list_items(str(sample_archive))
+        items = sz.list_items_array(str(sample_archive))
+        
+        assert len(items) == len(expected)
+        assert {'index', 'path', 'size', 'packed_size', 'crc', 'has_crc',
+                'is_directory', 'is_encrypted'} <= set(items.dtype.names)
+        for row, item in zip(items, expected):
+            assert row['index'] == item['index']
+            assert row['size'] == item['size']
+            assert row['packed_size'] == item['packed_size']
+            assert bool(row['is_directory']) == item['is_directory']
+            assert bool(row['is_encrypted']) == item['is_encrypted']
+            if item['crc'] is not None:
+                assert row['has_crc']
+                assert row['crc'] == item['crc']
+    
+    def test_path_column_holds_bytes(self, sample_archive):
+        """测试path列为未解码的UTF-8字节串"""
+        pytest.importorskip("numpy")
+        items = SevenZip().list_items_array(str(sample_archive))
+        
+        paths = list(items['path'])
+        assert all(isinstance(path, bytes) for path in paths)
+        assert any(path.endswith(b"a.txt") for path in paths)
+        assert any(path.endswith(b"b.txt") for path in paths)
+    
+    def test_empty_archive(self, empty_archive):
+        """测试空归档返回空数组"""
+        pytest.importorskip("numpy")
+        items = SevenZip().list_items_array(str(empty_archive))
+        
+        assert len(items) == 0
+        assert 'path' in items.dtype.names
+
+
+class TestExtractToMemoryview:
+    """SevenZip.extract_to_memoryview测试"""
+    
+    def test_contents_match(self, sample_archive):
+        """测试视图内容与提取的数据一致"""
+        sz = SevenZip()
+        expected = {b"a.txt": b"alpha" * 10, b"b.txt": b"bravo" * 20}
+        
+        for item in sz.list_items(str(sample_archive)):
+            view = sz.extract_to_memoryview(str(sample_archive), item['index'])
+            name = item['path'].encode('utf-8').rsplit(b"/", 1)[-1].rsplit(b"\\", 1)[-1]
+            assert bytes(view) == expected[name]
+            assert len(view) == item['size']
+    
+    def test_view_is_readonly(self, sample_archive):
+        """测试视图只读"""
+        view = SevenZip().extract_to_memoryview(str(sample_archive), 0)
+        
+        assert view.readonly
+        with pytest.raises(TypeError):
+            view[0] = 0
+    
+    def test_zero_size_item(self, tmp_path):
+        """测试零字节项目返回空视图"""
+        source = tmp_path / "empty.txt"
+        source.write_bytes(b"")
+        archive_path = tmp_path / "zero.7z"
+        SevenZip().compress(str(source), str(archive_path))
+        
+        view = SevenZip().extract_to_memoryview(str(archive_path), 0)
+        
+        assert isinstance(view, memoryview)
+        assert len(view) == 0
+        assert bytes(view) == b""
+
+
+class TestSevenZipError:
+    """SevenZipError测试"""
+    
+    def test_explicit_message(self):
+        """测试显式消息原样使用，args保持为(消息,)"""
+        error = SevenZipError(SzResult.CANCELLED, "cancelled by test")
+        
+        assert error.result == SzResult.CANCELLED
+        assert str(error) == "cancelled by test"
+        assert error.args == ("cancelled by test",)
+    
+    def test_lazy_message_keeps_detail(self, tmp_path):
+        """测试延迟格式化时仍使用抛出时的错误详情"""
+        with pytest.raises(SevenZipError) as first:
+            SevenZip().list_items(str(tmp_path / "missing.7z"))
+        detail = _lib.sz_get_last_error_message()
+        
+        # 再次失败会覆盖线程局部的错误详情
+        not_archive = tmp_path / "not_archive.7z"
+        not_archive.write_bytes(b"not an archive")
+        with pytest.raises(SevenZipError):
+            SevenZip().list_items(str(not_archive))
+        
+        message = str(first.value)
+        assert message.startswith(_lib.sz_error_to_string(first.value.result).decode('utf-8'))
+        if detail:
+            assert message.endswith(detail.decode('utf-8', 'replace'))
+        assert first.value.args == (message,)
+    
+    def test_pickle_round_trip(self, tmp_path):
+        """测试反序列化保留结果码与消息，不重新读取错误详情"""
+        with pytest.raises(SevenZipError) as exc_info:
+            SevenZip().list_items(str(tmp_path / "missing.7z"))
+        error = exc_info.value
+        
+        not_archive = tmp_path / "not_archive.7z"
+        not_archive.write_bytes(b"not an archive")
+        with pytest.raises(SevenZipError):
+            SevenZip().list_items(str(not_archive))
+        
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is SevenZipError
+        assert restored.result == error.result
+        assert str(restored) == str(error)
+        assert restored.args == error.args
+
+
+class TestEnumNames:
+    """格式/压缩级别名称解析测试"""
+    
+    @pytest.mark.parametrize("name, expected", [
+        ("7z", SzFormat.SEVENZIP),
+        ("SevenZip", SzFormat.SEVENZIP),
+        ("ZIP", SzFormat.ZIP),
+        ("gz", SzFormat.GZIP),
+        ("bz2", SzFormat.BZIP2),
+    ])
+    def test_known_names(self, name, expected):
+        """测试别名与大小写不敏感的名称"""
+        assert _lookup_enum(_FORMAT_MAP, name, 'format') is expected
+    
+    def test_unknown_format(self, tmp_path):
+        """测试未知格式抛出ValueError且不创建归档"""
+        source = tmp_path / "a.txt"
+        source.write_bytes(b"alpha")
+        archive_path = tmp_path / "out.rar"
+        
+        with pytest.raises(ValueError, match="Unknown format: 'rar'"):
+            SevenZip().compress(str(source), str(archive_path), format="rar")
+        with pytest.raises(ValueError, match="Unknown format"):
+            sevenzip_ffi.compress(str(source), str(archive_path), format="rar")
+        assert not archive_path.exists()
+    
+    def test_unknown_level(self, tmp_path):
+        """测试未知压缩级别抛出ValueError"""
+        source = tmp_path / "a.txt"
+        source.write_bytes(b"alpha")
+        
+        with pytest.raises(ValueError, match="Unknown compression level: 'best'"):
+            SevenZip().compress(str(source), str(tmp_path / "out.7z"), level="best")
+
+
+class TestCachedQueries:
+    """get_version/is_format_supported缓存测试"""
+    
+    def test_version_cached(self):
+        """测试版本字符串只查询一次"""
+        first = SevenZip.get_version()
+        hits = SevenZip.get_version.cache_info().hits
+        
+        assert SevenZip().get_version() is first
+        assert SevenZip.get_version.cache_info().hits == hits + 1
+    
+    def test_format_support_cached_per_name(self):
+        """测试格式支持按名称缓存"""
+        assert SevenZip.is_format_supported("7z")
+        info = SevenZip.is_format_supported.cache_info()
+        
+        assert SevenZip.is_format_supported("7z")
+        assert not SevenZip.is_format_supported("no-such-format")
+        assert not SevenZip.is_format_supported("no-such-format")
+        after = SevenZip.is_format_supported.cache_info()
+        assert after.hits == info.hits + 2
+        assert after.misses == info.misses + 1
@@ -55,6 +55,55 @@ class TestWriter:
             item = archive.get_item_info(0)
             assert "test.txt" in item.path
     
+    def test_add_files(self, tmp_path, temp_dir):
+        """测试批量添加文件"""
+        sources = []
+        for i in range(3):
+            f = temp_dir / f"batch{i}.txt"
+            f.write_text(f"Batch {i}")
+            sources.append(str(f))
+        
+        output = tmp_path / "batch.7z"
+        with Writer.create(str(output), format='7z') as writer:
+            writer.add_files(sources, ["a.txt", "b.txt", "dir/c.txt"])
+        
+        with Archive.open(str(output)) as archive:
+            paths = sorted(item.path.replace("\\", "/") for item in archive)
+            assert paths == ["a.txt", "b.txt", "dir/c.txt"]
+    
+    def test_add_files_default_names(self, tmp_path, temp_dir):
+        """测试批量添加文件时默认使用文件名"""
+        sources = []
+        for i in range(2):
+            f = temp_dir / f"named{i}.txt"
+            f.write_text(f"Named {i}")
+            sources.append(f)
+        
+        output = tmp_path / "named.7z"
+        with Writer.create(str(output), format='7z') as writer:
+            writer.add_files(sources)
+        
+        with Archive.open(str(output)) as archive:
+            assert sorted(item.path for item in archive) == ["named0.txt", "named1.txt"]
+    
+    def test_add_memory_buffers(self, tmp_path):
+        """测试从bytes/bytearray/memoryview添加内存数据"""
+        output = tmp_path / "memory.7z"
+        payloads = {
+            "bytes.bin": b"bytes payload",
+            "bytearray.bin": bytearray(b"bytearray payload"),
+            "memoryview.bin": memoryview(b"memoryview payload"),
+        }
+        
+        with Writer.create(str(output), format='7z') as writer:
+            for name, data in payloads.items():
+                writer.add_memory(data, name)
+        
+        with Archive.open(str(output)) as archive:
+            contents = {item.path: archive.extract_to_memory(item.index) for item in archive}
+        for name, data in payloads.items():
+            assert contents[name] == bytes(data)
+    
     def test_add_directory(self, tmp_path, temp_dir):
         """测试添加目录"""
         # 创建多个文件
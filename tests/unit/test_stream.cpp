@@ -14,15 +14,18 @@
 #include <string>
 #include <vector>
 
+#include "wrapper/archive/extract_callback.hpp"
 #include "wrapper/stream/stream_file.hpp"
 #include "wrapper/stream/stream_memory.hpp"
 
 // 声明 7-Zip COM 接口 IID
+#include "7zip/Archive/IArchive.h"
 #include "7zip/IStream.h"
 
 EXTERN_C const GUID IID_IInStream;
 EXTERN_C const GUID IID_IOutStream;
 EXTERN_C const GUID IID_IStreamGetSize;
+EXTERN_C const GUID IID_IInArchive;
 
 using namespace sevenzip;
 using namespace sevenzip::detail;
@@ -401,3 +404,405 @@ TEST(FileOutStreamTest, SetSize) {
         throw;
     }
 }
+
+// ======================== FileOutStream 缓冲模式测试 ========================
+
+namespace {
+
+std::vector<uint8_t> readFileBytes(const fs::path& path) {
+    std::ifstream ifs(path, std::ios::binary);
+    return std::vector<uint8_t>(std::istreambuf_iterator<char>(ifs),
+                                std::istreambuf_iterator<char>());
+}
+
+std::vector<uint8_t> bytesOf(const std::string& text) {
+    return std::vector<uint8_t>(text.begin(), text.end());
+}
+
+// 只回答属性查询的最小 IInArchive：所有项目都是普通文件，用于单独驱动提取回调
+class FakeFileArchive : public IInArchive, public CMyUnknownImp {
+    Z7_IFACES_IMP_UNK_1(IInArchive)
+};
+
+Z7_COM7F_IMF(FakeFileArchive::Open(IInStream*, const UInt64*, IArchiveOpenCallback*)) {
+    return E_NOTIMPL;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::Close()) {
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetNumberOfItems(UInt32* numItems)) {
+    *numItems = 1;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetProperty(UInt32, PROPID, PROPVARIANT* value)) {
+    value->vt = VT_EMPTY;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::Extract(const UInt32*, UInt32, Int32, IArchiveExtractCallback*)) {
+    return E_NOTIMPL;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetArchiveProperty(PROPID, PROPVARIANT* value)) {
+    value->vt = VT_EMPTY;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetNumberOfProperties(UInt32* numProps)) {
+    *numProps = 0;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetPropertyInfo(UInt32, BSTR*, PROPID*, VARTYPE*)) {
+    return E_INVALIDARG;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetNumberOfArchiveProperties(UInt32* numProps)) {
+    *numProps = 0;
+    return S_OK;
+}
+
+Z7_COM7F_IMF(FakeFileArchive::GetArchivePropertyInfo(UInt32, BSTR*, PROPID*, VARTYPE*)) {
+    return E_INVALIDARG;
+}
+
+// 超出任何文件系统最大文件大小的偏移，在此处写入必然失败
+constexpr Int64 kUnwritableOffset = Int64(1) << 62;
+
+}  // namespace
+
+TEST(FileOutStreamTest, BufferedCreateAndWrite) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_write.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 16));
+
+            uint8_t data[] = {100, 101, 102};
+            UInt32 processed = 0;
+            HRESULT hr = stream->Write(data, 3, &processed);
+
+            EXPECT_EQ(hr, S_OK);
+            EXPECT_EQ(processed, 3u);
+        }  // 析构时刷新缓冲并释放文件句柄
+
+        EXPECT_EQ(readFileBytes(tempFile), (std::vector<uint8_t>{100, 101, 102}));
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedFlush) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_flush.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 16));
+
+            auto first = bytesOf("abc");
+            stream->Write(first.data(), static_cast<UInt32>(first.size()), nullptr);
+            EXPECT_EQ(stream->flush(), S_OK);
+
+            // 缓冲为空时再次刷新也应成功
+            EXPECT_EQ(stream->flush(), S_OK);
+
+            auto second = bytesOf("def");
+            stream->Write(second.data(), static_cast<UInt32>(second.size()), nullptr);
+            EXPECT_EQ(stream->flush(), S_OK);
+        }
+
+        EXPECT_EQ(readFileBytes(tempFile), bytesOf("abcdef"));
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedSeekAndWrite) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_seek_write.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 64));
+
+            // 先写入 10 个字节（仍在缓冲中）
+            uint8_t data1[10] = {0};
+            stream->Write(data1, 10, nullptr);
+
+            // Seek 前必须先刷新，否则缓冲数据会写到新位置
+            UInt64 position = 0;
+            EXPECT_EQ(stream->Seek(5, STREAM_SEEK_SET, &position), S_OK);
+            EXPECT_EQ(position, 5u);
+
+            uint8_t data2[] = {77, 88, 99};
+            stream->Write(data2, 3, nullptr);
+        }
+
+        auto contents = readFileBytes(tempFile);
+        ASSERT_EQ(contents.size(), 10u);
+        EXPECT_EQ(contents[4], 0);
+        EXPECT_EQ(contents[5], 77);
+        EXPECT_EQ(contents[6], 88);
+        EXPECT_EQ(contents[7], 99);
+        EXPECT_EQ(contents[8], 0);
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedSetSize) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_setsize.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 64));
+
+            // 20 字节都在缓冲中，SetSize 前必须先写出，否则析构时的刷新会把文件重新撑大
+            uint8_t data[20] = {0};
+            stream->Write(data, 20, nullptr);
+
+            HRESULT hr = stream->SetSize(10);
+            EXPECT_EQ(hr, S_OK);
+        }
+
+        EXPECT_EQ(fs::file_size(tempFile), 10u);
+
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedLargeWriteBypassesBuffer) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_large_write.bin";
+
+    try {
+        std::vector<uint8_t> large(32);
+        for (size_t i = 0; i < large.size(); ++i) {
+            large[i] = static_cast<uint8_t>('A' + i % 26);
+        }
+
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 8));
+
+            auto head = bytesOf("1234");
+            stream->Write(head.data(), static_cast<UInt32>(head.size()), nullptr);
+
+            // 不小于缓冲大小的写入直接落盘，但必须排在已缓冲的数据之后
+            UInt32 processed = 0;
+            EXPECT_EQ(stream->Write(large.data(), static_cast<UInt32>(large.size()), &processed),
+                      S_OK);
+            EXPECT_EQ(processed, 32u);
+
+            auto tail = bytesOf("56");
+            stream->Write(tail.data(), static_cast<UInt32>(tail.size()), nullptr);
+        }
+
+        std::vector<uint8_t> expected = bytesOf("1234");
+        expected.insert(expected.end(), large.begin(), large.end());
+        expected.push_back('5');
+        expected.push_back('6');
+        EXPECT_EQ(readFileBytes(tempFile), expected);
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedInterleavedWriteAndSeek) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_interleaved.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 64));
+            UInt64 position = 0;
+
+            auto body = bytesOf("ABCDEFGH");
+            stream->Write(body.data(), static_cast<UInt32>(body.size()), nullptr);
+
+            // 相对当前位置的 Seek 依赖于缓冲已写出
+            EXPECT_EQ(stream->Seek(-2, STREAM_SEEK_CUR, &position), S_OK);
+            EXPECT_EQ(position, 6u);
+            auto lower = bytesOf("gh");
+            stream->Write(lower.data(), static_cast<UInt32>(lower.size()), nullptr);
+
+            EXPECT_EQ(stream->Seek(2, STREAM_SEEK_SET, &position), S_OK);
+            EXPECT_EQ(position, 2u);
+            auto middle = bytesOf("xy");
+            stream->Write(middle.data(), static_cast<UInt32>(middle.size()), nullptr);
+
+            EXPECT_EQ(stream->Seek(0, STREAM_SEEK_END, &position), S_OK);
+            EXPECT_EQ(position, 8u);
+            auto end = bytesOf("Z");
+            stream->Write(end.data(), static_cast<UInt32>(end.size()), nullptr);
+        }
+
+        EXPECT_EQ(readFileBytes(tempFile), bytesOf("ABxyEFghZ"));
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedReusesSpareBuffer) {
+    fs::path firstFile = fs::temp_directory_path() / "test_buffered_spare_1.bin";
+    fs::path secondFile = fs::temp_directory_path() / "test_buffered_spare_2.bin";
+
+    try {
+        {
+            // 大缓冲在析构后留作本线程的备用缓冲
+            CMyComPtr<FileOutStream> stream(new FileOutStream(firstFile.wstring(), true, 4096));
+            std::vector<uint8_t> data(100, 0xAA);
+            stream->Write(data.data(), static_cast<UInt32>(data.size()), nullptr);
+        }
+
+        {
+            // 复用的缓冲容量更大，但仍须按本流的 bufferSize 刷新，且不残留上一个流的数据
+            CMyComPtr<FileOutStream> stream(new FileOutStream(secondFile.wstring(), true, 4));
+
+            auto first = bytesOf("abc");
+            stream->Write(first.data(), static_cast<UInt32>(first.size()), nullptr);
+            auto second = bytesOf("def");
+            stream->Write(second.data(), static_cast<UInt32>(second.size()), nullptr);
+
+            stream->Seek(1, STREAM_SEEK_SET, nullptr);
+            auto patch = bytesOf("X");
+            stream->Write(patch.data(), static_cast<UInt32>(patch.size()), nullptr);
+        }
+
+        EXPECT_EQ(readFileBytes(firstFile), std::vector<uint8_t>(100, 0xAA));
+        EXPECT_EQ(readFileBytes(secondFile), bytesOf("aXcdef"));
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(firstFile);
+        fs::remove(secondFile);
+    } catch (...) {
+        fs::remove(firstFile);
+        fs::remove(secondFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, BufferedFlushReportsWriteError) {
+    fs::path tempFile = fs::temp_directory_path() / "test_buffered_flush_error.bin";
+
+    try {
+        {
+            CMyComPtr<FileOutStream> stream(new FileOutStream(tempFile.wstring(), true, 64));
+
+            ASSERT_EQ(stream->Seek(kUnwritableOffset, STREAM_SEEK_SET, nullptr), S_OK);
+
+            // 数据只进入缓冲，错误在刷新时才出现
+            uint8_t data[16] = {0};
+            EXPECT_EQ(stream->Write(data, 16, nullptr), S_OK);
+            EXPECT_TRUE(FAILED(stream->flush()));
+        }
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, ExtractCallbackFlushesOnSuccess) {
+    fs::path tempFile = fs::temp_directory_path() / "test_extract_callback_flush.bin";
+
+    try {
+        CMyComPtr<IInArchive> archive(new FakeFileArchive);
+        CMyComPtr<IArchiveExtractCallback> callback(new ExtractToFileCallback(archive, tempFile));
+
+        CMyComPtr<ISequentialOutStream> outStream;
+        ASSERT_EQ(callback->GetStream(0, &outStream, 0), S_OK);
+        ASSERT_TRUE(outStream);
+
+        auto data = bytesOf("buffered payload");
+        EXPECT_EQ(outStream->Write(data.data(), static_cast<UInt32>(data.size()), nullptr), S_OK);
+        outStream.Release();
+
+        // kOK：回调显式刷新并报告成功
+        EXPECT_EQ(callback->SetOperationResult(0), S_OK);
+        callback.Release();
+
+        EXPECT_EQ(readFileBytes(tempFile), data);
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}
+
+TEST(FileOutStreamTest, ExtractCallbackPropagatesWriteError) {
+    fs::path tempFile = fs::temp_directory_path() / "test_extract_callback_error.bin";
+
+    try {
+        CMyComPtr<IInArchive> archive(new FakeFileArchive);
+        CMyComPtr<IArchiveExtractCallback> callback(new ExtractToFileCallback(archive, tempFile));
+
+        CMyComPtr<ISequentialOutStream> outStream;
+        ASSERT_EQ(callback->GetStream(0, &outStream, 0), S_OK);
+        ASSERT_TRUE(outStream);
+
+        CMyComPtr<IOutStream> seekable;
+        ASSERT_EQ(outStream.QueryInterface(IID_IOutStream, &seekable), S_OK);
+        ASSERT_EQ(seekable->Seek(kUnwritableOffset, STREAM_SEEK_SET, nullptr), S_OK);
+
+        uint8_t data[16] = {0};
+        EXPECT_EQ(outStream->Write(data, 16, nullptr), S_OK);
+        seekable.Release();
+        outStream.Release();
+
+        // 解码本身成功（kOK），但缓冲写出失败：错误必须返回给 7-Zip，且删除不完整的文件
+        EXPECT_TRUE(FAILED(callback->SetOperationResult(0)));
+        callback.Release();
+
+#ifdef _WIN32
+        Sleep(10);  // Windows 需要短暂延迟让系统释放句柄
+#endif
+        EXPECT_FALSE(fs::exists(tempFile));
+        fs::remove(tempFile);
+    } catch (...) {
+        fs::remove(tempFile);
+        throw;
+    }
+}